@@ -1,14 +1,17 @@
 import streamlit as st
-import yfinance as yf
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+import os
 import time
-from database import Database
+from data_sources import get_market_data as load_market_data, get_provider
+from database import Database, RecommendationWriter
 from indicators import TechnicalIndicators
+from poller import MarketPoller
+from profiling import StageTimer, format_stats, profiled
+from singleflight import SingleFlight
 from strategy import TradingStrategy
+from scanner import DEFAULT_WATCHLIST, WatchlistScanner
 
 # Page configuration
 st.set_page_config(
@@ -18,8 +21,42 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Initialize database
-db = Database()
+# Initialize database (one pooled instance shared by every session and rerun)
+@st.cache_resource
+def get_database():
+    return Database()
+
+db = get_database()
+
+# Recommendations are persisted off the script thread so reruns never wait on SQLite
+@st.cache_resource
+def get_writer():
+    return RecommendationWriter(get_database())
+
+writer = get_writer()
+
+# Market data source (MARKET_DATA_PROVIDER=yahoo|replay|synthetic), kept across
+# reruns so its bar cache and replay cursors survive
+@st.cache_resource
+def get_data_provider():
+    return get_provider()
+
+data_provider = get_data_provider()
+
+# Process-wide: sessions asking the provider for the same bars at the same
+# time wait on one fetch and share its (read-only) result. The cache_data
+# stages below need no such wrapper: Streamlit already lets only one caller
+# compute a missing entry while the others wait for it.
+@st.cache_resource
+def get_single_flight():
+    return SingleFlight()
+
+def fetch_history(symbol, period, interval):
+    """Bars from the data provider, with concurrent identical requests coalesced"""
+    return get_single_flight().do(
+        ('bars', symbol, period, interval),
+        data_provider.get_history, symbol, period=period, interval=interval
+    )
 
 # Custom CSS
 st.markdown("""
@@ -52,152 +89,68 @@ st.markdown("""
     </style>
     """, unsafe_allow_html=True)
 
-def get_market_data(symbol, period="3mo", interval="1d"):
-    """Fetch market data from Yahoo Finance"""
-    try:
-        ticker = yf.Ticker(symbol)
-        # Yahoo Finance limitations:
-        # 1m interval: max 7 days
-        # 5m interval: max 60 days
-        # 1h interval: max 730 days
-        # 1d interval: unlimited
-        
-        # Adjust period/interval combination based on Yahoo Finance limits
-        if interval == "1m":
-            period = "7d"  # 1-minute data only available for last 7 days
-        elif interval == "5m":
-            period = "60d" if period in ["3mo", "6mo", "1y"] else period
-        
-        df = ticker.history(period=period, interval=interval)
-        
-        if df.empty:
-            st.warning(f"No data returned for {symbol}. Trying with daily data...")
-            # Fallback to daily data
-            df = ticker.history(period="1y", interval="1d")
-        
-        return df
-    except Exception as e:
-        st.error(f"Error fetching data: {e}")
-        return None
+# Pipeline stages are cached separately so a widget change only recomputes
+# what depends on it: bars per symbol/interval (refreshed every minute),
+# indicators and strategy scoring per bar snapshot (see bars_key), while
+# margin/leverage only feed TradingStrategy.add_targets(), which always runs.
+# The margin/leverage inputs sit inside the live fragment, so editing them
+# re-runs that fragment alone and the charts are not re-sent to the browser.
+@st.cache_data(ttl=60, max_entries=64, show_spinner=False)
+def fetch_bars(symbol, period, interval):
+    return fetch_history(symbol, period, interval)
 
-def create_candlestick_chart(df, symbol):
-    """Create candlestick chart with volume"""
-    fig = make_subplots(
-        rows=2, cols=1,
-        shared_xaxes=True,
-        vertical_spacing=0.03,
-        subplot_titles=(f'{symbol} Price', 'Volume'),
-        row_heights=[0.7, 0.3]
-    )
-    
-    # Candlestick
-    fig.add_trace(
-        go.Candlestick(
-            x=df.index,
-            open=df['Open'],
-            high=df['High'],
-            low=df['Low'],
-            close=df['Close'],
-            name='Price'
-        ),
-        row=1, col=1
-    )
-    
-    # Volume bars
-    colors = ['red' if df['Close'].iloc[i] < df['Open'].iloc[i] else 'green' 
-              for i in range(len(df))]
-    fig.add_trace(
-        go.Bar(x=df.index, y=df['Volume'], name='Volume', marker_color=colors),
-        row=2, col=1
-    )
-    
-    fig.update_layout(
-        height=600,
-        showlegend=False,
-        xaxis_rangeslider_visible=False
-    )
-    
-    fig.update_xaxes(title_text="Date", row=2, col=1)
-    fig.update_yaxes(title_text="Price", row=1, col=1)
-    fig.update_yaxes(title_text="Volume", row=2, col=1)
-    
-    return fig
+# Shared by every session: one thread refreshes each watched series once a
+# minute, so auto-refreshing sessions read the latest bars without fetching
+@st.cache_resource
+def get_poller():
+    return MarketPoller(poll_history, interval=60)
 
-def create_indicators_chart(df, indicators_data):
-    """Create technical indicators chart"""
-    fig = make_subplots(
-        rows=3, cols=1,
-        shared_xaxes=True,
-        vertical_spacing=0.05,
-        subplot_titles=('Price with Moving Averages', 'RSI', 'MACD'),
-        row_heights=[0.5, 0.25, 0.25]
-    )
-    
-    # Price with MAs
-    fig.add_trace(
-        go.Scatter(x=df.index, y=df['Close'], name='Close', line=dict(color='blue')),
-        row=1, col=1
-    )
-    fig.add_trace(
-        go.Scatter(x=df.index, y=indicators_data['SMA_20'], name='SMA 20', 
-                   line=dict(color='orange', dash='dash')),
-        row=1, col=1
-    )
-    fig.add_trace(
-        go.Scatter(x=df.index, y=indicators_data['SMA_50'], name='SMA 50', 
-                   line=dict(color='red', dash='dash')),
-        row=1, col=1
-    )
-    fig.add_trace(
-        go.Scatter(x=df.index, y=indicators_data['EMA_12'], name='EMA 12', 
-                   line=dict(color='purple', dash='dot')),
-        row=1, col=1
-    )
-    
-    # Bollinger Bands
-    fig.add_trace(
-        go.Scatter(x=df.index, y=indicators_data['BB_upper'], name='BB Upper',
-                   line=dict(color='gray', dash='dash'), opacity=0.5),
-        row=1, col=1
-    )
-    fig.add_trace(
-        go.Scatter(x=df.index, y=indicators_data['BB_lower'], name='BB Lower',
-                   line=dict(color='gray', dash='dash'), opacity=0.5,
-                   fill='tonexty', fillcolor='rgba(128,128,128,0.2)'),
-        row=1, col=1
-    )
-    
-    # RSI
-    fig.add_trace(
-        go.Scatter(x=df.index, y=indicators_data['RSI'], name='RSI', 
-                   line=dict(color='purple')),
-        row=2, col=1
-    )
-    fig.add_hline(y=70, line_dash="dash", line_color="red", row=2, col=1)
-    fig.add_hline(y=30, line_dash="dash", line_color="green", row=2, col=1)
-    
-    # MACD
-    fig.add_trace(
-        go.Scatter(x=df.index, y=indicators_data['MACD'], name='MACD', 
-                   line=dict(color='blue')),
-        row=3, col=1
-    )
-    fig.add_trace(
-        go.Scatter(x=df.index, y=indicators_data['MACD_signal'], name='Signal', 
-                   line=dict(color='red')),
-        row=3, col=1
-    )
-    fig.add_trace(
-        go.Bar(x=df.index, y=indicators_data['MACD_hist'], name='Histogram'),
-        row=3, col=1
-    )
-    
-    fig.update_layout(height=800, showlegend=True)
-    fig.update_yaxes(title_text="Price", row=1, col=1)
-    fig.update_yaxes(title_text="RSI", row=2, col=1)
-    fig.update_yaxes(title_text="MACD", row=3, col=1)
+def poll_history(symbol, period, interval):
+    """fetch_history for the poller, which always wants the newest candle"""
+    data_provider.expire(symbol, interval)
+    return fetch_history(symbol, period, interval)
+
+def get_market_data(symbol, period="3mo", interval="1d", live=False):
+    """
+    Fetch market data from the configured data provider (Yahoo Finance by default)
     
-    return fig
+    With live=True the bars come from the shared background poller. The
+    daily fallback and error handling are data_sources.get_market_data's.
+    """
+    return load_market_data(symbol, period, interval,
+                            fetch=get_poller().get if live else fetch_bars,
+                            warn=st.warning, error=st.error)
+
+def bars_key(df):
+    """
+    Cheap fingerprint of a bar series: length, first and last timestamp and the
+    last bar's values (the newest candle is updated in place while it forms)
+    """
+    return (len(df), df.index[0], df.index[-1], tuple(df.iloc[-1].tolist()))
+
+# The leading-underscore arguments are not hashed by Streamlit; data_key
+# identifies them instead.
+@st.cache_data(max_entries=32, show_spinner=False)
+def compute_indicators(symbol, interval, data_key, _df):
+    return TechnicalIndicators(_df).calculate_all()
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def evaluate_strategy(symbol, interval, data_key, _df, _indicators):
+    return TradingStrategy(_df, _indicators).evaluate()
+
+# Figures are memoized per symbol, interval, bars and chart settings so reruns
+# caused by other sidebar widgets reuse the built figure.
+# charts (and with it Plotly) is imported on first use rather than at startup,
+# keeping it off the cold-start path (see benchmarks/check_import_time.py).
+@st.cache_resource(max_entries=16)
+def cached_candlestick_chart(symbol, interval, data_key, max_points, bars, _df):
+    from charts import create_candlestick_chart
+    return create_candlestick_chart(_df, symbol, max_points, bars)
+
+@st.cache_resource(max_entries=16)
+def cached_indicators_chart(symbol, interval, data_key, max_points, bars, webgl, _df, _indicators):
+    from charts import create_indicators_chart
+    return create_indicators_chart(_df, _indicators, max_points, bars, webgl)
 
 def display_recommendation(signal, entry_price, targets, stop_loss, confidence, cfd=None):
     """Display trading recommendation with CFD calculations"""
@@ -267,6 +220,209 @@ def display_recommendation(signal, entry_price, targets, stop_loss, confidence,
             
             st.error(f"**At Stop Loss (-2%): ${cfd['loss_at_stop']:.2f} (ROI: {cfd['roi_at_stop']:.1f}%)**")
 
+def display_live_signal(instrument, interval, live=False, timings=False):
+    """
+    Price metrics, trading recommendation and signal breakdown
+    
+    Run as a fragment: with auto-refresh on, only this section re-runs on a
+    timer (reading the poller's latest bars) and no script thread is held
+    between updates. The margin/leverage inputs live here too, so changing
+    them re-runs only this section (not the charts below it). With timings
+    on, each run's stage timings are logged and kept in
+    st.session_state['live_timings'] for the profiler panel.
+    
+    A failure is reported here rather than raised, so it cannot take down
+    the charts and tabs rendered after this section.
+    """
+    timer = StageTimer(enabled=timings, run='live')
+    try:
+        display_live_section(instrument, interval, live, timer)
+    except Exception as e:
+        st.error(f"❌ Error updating the live signal: {e}")
+    finally:
+        # Recorded even when a stage failed, so the slow or failing stage shows up
+        if timings:
+            timer.log(symbol=instrument)
+            st.session_state['live_timings'] = timer.as_dict()
+
+def display_live_section(instrument, interval, live, timer):
+    """Body of display_live_signal, with each stage timed by `timer`"""
+    with timer.stage('fetch'):
+        df = get_market_data(instrument, period="3mo", interval=interval, live=live)
+    if df is None or df.empty:
+        return
+    
+    current_price = float(df['Close'].iloc[-1])
+    with timer.stage('indicators'):
+        data_key = bars_key(df)
+        indicators_data = compute_indicators(instrument, interval, data_key, df)
+    
+    # Display current price and key metrics
+    price_change = float(df['Close'].iloc[-1]) - float(df['Close'].iloc[-2])
+    price_change_pct = (price_change / float(df['Close'].iloc[-2])) * 100
+    
+    st.header(f"{instrument}")
+    col1, col2, col3, col4, col5 = st.columns(5)
+    
+    with col1:
+        st.metric(
+            "Current Price",
+            f"${current_price:.2f}",
+            f"{price_change_pct:+.2f}%"
+        )
+    
+    with col2:
+        st.metric("Volume", f"{df['Volume'].iloc[-1]:,.0f}")
+    
+    with col3:
+        st.metric("RSI", f"{indicators_data['RSI'].iloc[-1]:.1f}")
+    
+    with col4:
+        st.metric("High (24h)", f"${df['High'].max():.2f}")
+    
+    with col5:
+        st.metric("Low (24h)", f"${df['Low'].min():.2f}")
+    
+    st.markdown("---")
+    
+    # CFD Trading Parameters
+    st.subheader("💰 CFD Trading Setup")
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        margin = st.number_input(
+            "Trading Margin ($)",
+            min_value=100.0,
+            max_value=1000000.0,
+            value=1000.0,
+            step=100.0,
+            key="cfd_margin",
+            help="Your trading capital/margin"
+        )
+    
+    with col2:
+        leverage = st.number_input(
+            "Leverage Multiplier",
+            min_value=1,
+            max_value=500,
+            value=20,
+            step=1,
+            key="cfd_leverage",
+            help="Leverage multiplier (1x = no leverage, 20x = 20:1 leverage)"
+        )
+    
+    # Auto-calculate position size: (Margin × Leverage) / Price
+    position_size = (margin * leverage) / current_price
+    
+    with col3:
+        st.metric("Position Size (auto)", f"{position_size:.4f} units",
+                  help="(Margin × Leverage) / Instrument Price")
+    
+    # Generate trading signal (scoring is cached; targets follow margin/leverage)
+    try:
+        with timer.stage('signal'):
+            evaluation = evaluate_strategy(instrument, interval, data_key, df, indicators_data)
+            strategy = TradingStrategy(df, indicators_data)
+            recommendation = strategy.add_targets(evaluation, margin, leverage, position_size)
+    except Exception as e:
+        import traceback
+        error_details = traceback.format_exc()
+        st.error(f"❌ **Error generating signal:**\n\n{str(e)}")
+        with st.expander("🔍 Show Full Error Details"):
+            st.code(error_details)
+        st.warning("This might be due to insufficient data or data type issues. Try a different instrument like AAPL or BTC-USD.")
+        return
+    
+    # Display recommendation
+    st.header("Trading Recommendation")
+    display_recommendation(
+        recommendation['signal'],
+        recommendation['entry_price'],
+        recommendation['targets'],
+        recommendation['stop_loss'],
+        recommendation['confidence'],
+        recommendation.get('cfd')
+    )
+    
+    # Save to database (queued; repeats of the last recommendation are dropped)
+    if recommendation['signal'] in ["BUY", "SELL"]:
+        with timer.stage('db_write'):
+            writer.submit(
+                symbol=instrument,
+                signal=recommendation['signal'],
+                entry_price=recommendation['entry_price'],
+                target_3=recommendation['targets']['3%'],
+                target_5=recommendation['targets']['5%'],
+                target_10=recommendation['targets']['10%'],
+                stop_loss=recommendation['stop_loss'],
+                confidence=recommendation['confidence'],
+                indicators=recommendation['indicators']
+            )
+    
+    st.markdown("---")
+    
+    # Signal explanation
+    with st.expander("🔍 Signal Breakdown"):
+        st.write("**Factors Contributing to Signal:**")
+        for indicator, value in recommendation['indicators'].items():
+            # Votes are -1/0/+1; descriptive entries (Volatility, Volume_Spike,
+            # Trend_Strength) are strings and shown as they are
+            if not isinstance(value, (int, float)):
+                st.info(f"○ {indicator}: {value}")
+            elif value > 0:
+                st.success(f"✓ {indicator}: Bullish signal")
+            elif value < 0:
+                st.error(f"✗ {indicator}: Bearish signal")
+            else:
+                st.info(f"○ {indicator}: Neutral")
+    
+    # Last update time
+    st.caption(f"Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+
+def display_timings(timer, live_timings=None, stats=None):
+    """Per-stage timing breakdown of this rerun (plus the latest live-section run)"""
+    rows = [{'stage': name, 'ms': seconds * 1000} for name, seconds in timer.stages.items()]
+    if live_timings:
+        rows += [{'stage': f"live.{name}", 'ms': ms} for name, ms in live_timings['stages_ms'].items()]
+    
+    st.caption(f"Rerun total: {timer.total() * 1000:.0f} ms")
+    st.dataframe(pd.DataFrame(rows), hide_index=True, use_container_width=True)
+    
+    if stats is not None:
+        with st.expander("cProfile (top 25 by cumulative time)"):
+            st.code(format_stats(stats, 25))
+
+def display_watchlist_scanner():
+    """Scan a watchlist concurrently and show a sortable signal table"""
+    watchlist = st.text_area(
+        "Watchlist (one symbol per line or comma-separated)",
+        value="\n".join(DEFAULT_WATCHLIST),
+        height=150
+    )
+    
+    if st.button("🔎 Scan Watchlist"):
+        symbols = watchlist.replace(",", "\n").splitlines()
+        scanner = WatchlistScanner(data_provider)
+        start = time.perf_counter()
+        with st.spinner(f"Scanning {len(symbols)} symbols..."):
+            st.session_state['scan_results'] = scanner.scan(symbols)
+        st.session_state['scan_seconds'] = time.perf_counter() - start
+    
+    results = st.session_state.get('scan_results')
+    if results is not None:
+        st.caption(f"Scanned {len(results)} symbols in {st.session_state['scan_seconds']:.1f}s")
+        st.dataframe(
+            results,
+            use_container_width=True,
+            hide_index=True,
+            column_config={
+                "confidence": st.column_config.NumberColumn("Confidence", format="%.1f%%"),
+                "score": st.column_config.NumberColumn("Score", format="%.2f"),
+                "price": st.column_config.NumberColumn("Price", format="%.4f"),
+                "change_pct": st.column_config.NumberColumn("Change", format="%+.2f%%"),
+            }
+        )
+
 def main():
     st.title("📈 CFD Trading Dashboard - Live Signals with Leverage")
     
@@ -296,27 +452,25 @@ def main():
         
         st.markdown("---")
         
-        # CFD Trading Parameters
-        st.subheader("💰 CFD Trading Setup")
-        margin = st.number_input(
-            "Trading Margin ($)",
-            min_value=100.0,
-            max_value=1000000.0,
-            value=1000.0,
-            step=100.0,
-            help="Your trading capital/margin"
+        # Chart display (bars shown and points sent to the browser per trace)
+        st.subheader("📉 Chart Display")
+        chart_window = st.selectbox(
+            "Chart Window",
+            ["All bars", "Last 5000 bars", "Last 1000 bars", "Last 250 bars"],
+            help="Zoom in to a recent window; fewer bars are drawn with more detail"
         )
-        
-        leverage = st.number_input(
-            "Leverage Multiplier",
-            min_value=1,
-            max_value=500,
-            value=20,
-            step=1,
-            help="Leverage multiplier (1x = no leverage, 20x = 20:1 leverage)"
+        chart_bars = None if chart_window == "All bars" else int(chart_window.split()[1])
+        chart_points = st.select_slider(
+            "Chart Resolution (points)",
+            options=[500, 1000, 2000, 4000, 8000],
+            value=2000,
+            help="Longer histories are downsampled to this many candles/points per series"
+        )
+        chart_webgl = st.checkbox(
+            "WebGL indicator chart",
+            value=True,
+            help="Draw indicator lines with WebGL (faster for long histories)"
         )
-        
-        st.info(f"💡 **Position Size will be auto-calculated:**\n\n(Margin × Leverage) / Instrument Price")
         
         st.markdown("---")
         
@@ -324,11 +478,30 @@ def main():
         auto_refresh = st.checkbox("Auto-refresh (1 min)", value=False)
         
         if st.button("🔄 Refresh Now"):
+            # Drop the cached bars and skip the provider's bar-cache TTL, so
+            # the rerun tops the series up with the newest candles
+            fetch_bars.clear()
+            data_provider.expire(instrument)
             st.rerun()
         
+        st.markdown("---")
+        
+        # Profiler (off by default; DASHBOARD_TIMINGS=1 turns it on for every session)
+        st.subheader("⏱️ Profiler")
+        show_timings = st.checkbox(
+            "Stage timings",
+            value=os.environ.get('DASHBOARD_TIMINGS') == '1',
+            help="Time each pipeline stage, show the breakdown here and log it as JSON"
+        )
+        profile_rerun = st.button("Profile one rerun (cProfile)", disabled=not show_timings)
+        timings_panel = st.empty()
+        timer = StageTimer(enabled=show_timings)
+        
         st.markdown("---")
         st.subheader("Recent Recommendations")
-        recent = db.get_recent_recommendations(5)
+        with timer.stage('db_read'):
+            recent = db.get_recent_recommendations(
+                5, columns=['symbol', 'signal', 'entry_price', 'confidence'])
         if not recent.empty:
             for _, rec in recent.iterrows():
                 with st.expander(f"{rec['symbol']} - {rec['signal']}"):
@@ -337,105 +510,60 @@ def main():
                     st.write(f"Confidence: {rec['confidence']:.1f}%")
     
     # Main content
+    with profiled(profile_rerun) as profile:
+        display_analysis(instrument, auto_refresh, chart_points, chart_bars, chart_webgl, timer)
+    
+    timer.log(symbol=instrument)
+    if show_timings:
+        with timings_panel.container():
+            display_timings(timer, st.session_state.get('live_timings'), profile.get('stats'))
+
+def display_analysis(instrument, auto_refresh, chart_points, chart_bars, chart_webgl, timer):
+    """Market data, live signal, charts and indicator details for the instrument"""
     if instrument:
         try:
             # Fetch data
-            with st.spinner("Fetching market data..."):
-                df = get_market_data(instrument, period="3mo", interval="1h")
+            interval = "1h"
+            with st.spinner("Fetching market data..."), timer.stage('fetch'):
+                df = get_market_data(instrument, period="3mo", interval=interval, live=auto_refresh)
             
             if df is not None and not df.empty:
-                # Get current price first
+                # Check the latest bar has a usable price first
                 try:
-                    current_price = float(df['Close'].iloc[-1])
+                    float(df['Close'].iloc[-1])
                 except (TypeError, ValueError, KeyError, IndexError) as e:
                     st.error(f"Error getting current price: {e}")
                     st.stop()
                 
-                # Auto-calculate position size: (Margin × Leverage) / Price
-                position_size = (margin * leverage) / current_price
-                
-                st.sidebar.success(f"📊 **Auto-Calculated:**\n\nPosition Size: {position_size:.4f} units")
-                
                 # Calculate indicators
-                ti = TechnicalIndicators(df)
-                indicators_data = ti.calculate_all()
+                with timer.stage('indicators'):
+                    data_key = bars_key(df)
+                    indicators_data = compute_indicators(instrument, interval, data_key, df)
                 
-                # Generate trading signal
-                try:
-                    strategy = TradingStrategy(df, indicators_data)
-                    recommendation = strategy.generate_signal(margin, leverage, position_size)
-                except Exception as e:
-                    import traceback
-                    error_details = traceback.format_exc()
-                    st.error(f"❌ **Error generating signal:**\n\n{str(e)}")
-                    with st.expander("🔍 Show Full Error Details"):
-                        st.code(error_details)
-                    st.warning("This might be due to insufficient data or data type issues. Try a different instrument like AAPL or BTC-USD.")
-                    st.stop()
-                
-                # Display current price and key metrics
-                price_change = float(df['Close'].iloc[-1]) - float(df['Close'].iloc[-2])
-                price_change_pct = (price_change / float(df['Close'].iloc[-2])) * 100
-                
-                st.header(f"{instrument}")
-                col1, col2, col3, col4, col5 = st.columns(5)
-                
-                with col1:
-                    st.metric(
-                        "Current Price",
-                        f"${current_price:.2f}",
-                        f"{price_change_pct:+.2f}%"
+                with timer.stage('live_section'):
+                    st.fragment(display_live_signal, run_every=60 if auto_refresh else None)(
+                        instrument, interval, live=auto_refresh, timings=timer.enabled
                     )
                 
-                with col2:
-                    st.metric("Volume", f"{df['Volume'].iloc[-1]:,.0f}")
-                
-                with col3:
-                    st.metric("RSI", f"{indicators_data['RSI'].iloc[-1]:.1f}")
-                
-                with col4:
-                    st.metric("High (24h)", f"${df['High'].max():.2f}")
-                
-                with col5:
-                    st.metric("Low (24h)", f"${df['Low'].min():.2f}")
-                
-                st.markdown("---")
-                
-                # Display recommendation
-                st.header("Trading Recommendation")
-                display_recommendation(
-                    recommendation['signal'],
-                    recommendation['entry_price'],
-                    recommendation['targets'],
-                    recommendation['stop_loss'],
-                    recommendation['confidence'],
-                    recommendation.get('cfd')
-                )
+                # Charts
+                tab1, tab2, tab3 = st.tabs(["📊 Price Chart", "📈 Technical Indicators", "🔎 Watchlist Scanner"])
                 
-                # Save to database
-                if recommendation['signal'] in ["BUY", "SELL"]:
-                    db.add_recommendation(
-                        symbol=instrument,
-                        signal=recommendation['signal'],
-                        entry_price=recommendation['entry_price'],
-                        target_3=recommendation['targets']['3%'],
-                        target_5=recommendation['targets']['5%'],
-                        target_10=recommendation['targets']['10%'],
-                        stop_loss=recommendation['stop_loss'],
-                        confidence=recommendation['confidence'],
-                        indicators=str(recommendation['indicators'])
+                with tab1, timer.stage('chart_price'):
+                    st.plotly_chart(
+                        cached_candlestick_chart(instrument, interval, data_key,
+                                                 chart_points, chart_bars, df),
+                        use_container_width=True
                     )
                 
-                st.markdown("---")
-                
-                # Charts
-                tab1, tab2 = st.tabs(["📊 Price Chart", "📈 Technical Indicators"])
-                
-                with tab1:
-                    st.plotly_chart(create_candlestick_chart(df, instrument), use_container_width=True)
+                with tab2, timer.stage('chart_indicators'):
+                    st.plotly_chart(
+                        cached_indicators_chart(instrument, interval, data_key, chart_points,
+                                                chart_bars, chart_webgl, df, indicators_data),
+                        use_container_width=True
+                    )
                 
-                with tab2:
-                    st.plotly_chart(create_indicators_chart(df, indicators_data), use_container_width=True)
+                with tab3:
+                    display_watchlist_scanner()
                 
                 # Detailed indicators
                 with st.expander("📊 Detailed Indicator Values"):
@@ -461,25 +589,6 @@ def main():
                         st.write(f"BB Middle: ${indicators_data['BB_middle'].iloc[-1]:.2f}")
                         st.write(f"BB Lower: ${indicators_data['BB_lower'].iloc[-1]:.2f}")
                         st.write(f"ATR: {indicators_data['ATR'].iloc[-1]:.2f}")
-                
-                # Signal explanation
-                with st.expander("🔍 Signal Breakdown"):
-                    st.write("**Factors Contributing to Signal:**")
-                    for indicator, value in recommendation['indicators'].items():
-                        if value > 0:
-                            st.success(f"✓ {indicator}: Bullish signal")
-                        elif value < 0:
-                            st.error(f"✗ {indicator}: Bearish signal")
-                        else:
-                            st.info(f"○ {indicator}: Neutral")
-                
-                # Last update time
-                st.caption(f"Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-                
-                # Auto-refresh
-                if auto_refresh:
-                    time.sleep(60)
-                    st.rerun()
             
             else:
                 st.error("No data available for this instrument. Please check the symbol.")
@@ -0,0 +1,229 @@
+import numpy as np
+import pandas as pd
+
+from indicators import TechnicalIndicators
+from strategy import STOP_LOSS_MULTIPLIERS, TARGET_MULTIPLIERS, TradingStrategy
+
+
+def _sparse_max_table(values):
+    """
+    Sparse table of forward running maxima
+
+    table[k][j] is the max of values[j:j + 2**k] (clipped at the end of the
+    array). NaN is stored as -inf so missing bars never count as a crossing.
+    """
+    table = [np.where(np.isnan(values), -np.inf, values)]
+    n = len(values)
+    step = 1
+    while step < n:
+        previous = table[-1]
+        current = previous.copy()
+        current[:n - step] = np.fmax(previous[:n - step], previous[step:])
+        table.append(current)
+        step *= 2
+    return table
+
+
+def _first_at_or_above(table, starts, levels, limits):
+    """
+    Index of the first bar in [start, limit] whose value reaches `level`
+
+    Binary lifting over the sparse table resolves every query at once in
+    O(log n) array operations. Returns -1 where the level is never reached.
+    """
+    n = len(table[0])
+    position = starts.copy()
+    for k in range(len(table) - 1, -1, -1):
+        inside = position < n
+        block_max = np.full(len(position), np.inf)
+        block_max[inside] = table[k][position[inside]]
+        position = np.where(inside & (block_max < levels), position + 2 ** k, position)
+
+    hit = (position < n) & (position <= limits)
+    return np.where(hit, position, -1)
+
+
+def simulate(high, low, close, signals, margin=1000, leverage=1, position_size=None,
+             target='5%', max_holding=None, overlapping=False):
+    """
+    Simulate trades entered on BUY/SELL signals
+
+    Each trade enters at the close of its signal bar and exits at the first
+    later bar that touches the stop loss or the chosen profit target from
+    TradingStrategy.calculate_targets (the stop wins if both are touched on
+    the same bar). Trades that hit neither are closed at the close of the
+    last bar or after `max_holding` bars. Profit follows the CFD math in
+    calculate_targets: price move * position_size * leverage.
+
+    Args:
+        high, low, close: Price arrays
+        signals: Array of "BUY"/"SELL"/"HOLD" per bar
+        margin: Trading margin per trade (default: $1000)
+        leverage: Leverage multiplier (default: 1x)
+        position_size: Units per trade; defaults to (margin * leverage) / entry
+                       price, like the dashboard
+        target: Profit target used for exits ('3%', '5%' or '10%')
+        max_holding: Optional maximum number of bars a trade stays open
+        overlapping: Take every signal bar as a trade instead of waiting for
+                     the previous trade to exit
+
+    Returns:
+        Dictionary of per-trade NumPy arrays ('entry_index', 'exit_index',
+        'direction', 'entry_price', 'exit_price', 'exit_reason', 'pnl',
+        'roi', and 'hit_3%'/'hit_5%'/'hit_10%')
+    """
+    high = np.asarray(high, dtype=float)
+    low = np.asarray(low, dtype=float)
+    close = np.asarray(close, dtype=float)
+    signals = np.asarray(signals)
+    n = len(close)
+
+    candidates = np.flatnonzero((signals == 'BUY') | (signals == 'SELL'))
+    candidates = candidates[candidates < n - 1]
+    is_long = signals[candidates] == 'BUY'
+    entry_price = close[candidates]
+
+    starts = candidates + 1
+    limits = np.full(len(candidates), n - 1)
+    if max_holding is not None:
+        limits = np.minimum(candidates + max_holding, n - 1)
+
+    # Long trades are stopped by lows and take profit on highs; shorts the
+    # reverse. Searching -low turns "at or below" into "at or above".
+    high_table = _sparse_max_table(high)
+    low_table = _sparse_max_table(-low)
+
+    def first_touch(multipliers, favourable):
+        """First bar reaching entry * multiplier in the given direction"""
+        levels = entry_price * multipliers
+        use_high = is_long == favourable
+        touch_up = _first_at_or_above(high_table, starts, levels, limits)
+        touch_down = _first_at_or_above(low_table, starts, -levels, limits)
+        return np.where(use_high, touch_up, touch_down)
+
+    def stop_first(target_hit, stop_hit):
+        """Whether the stop is touched no later than the target"""
+        return (stop_hit >= 0) & ((target_hit < 0) | (stop_hit <= target_hit))
+
+    stop_multiplier = np.where(is_long, STOP_LOSS_MULTIPLIERS['BUY'], STOP_LOSS_MULTIPLIERS['SELL'])
+    stop_hit = first_touch(stop_multiplier, favourable=False)
+
+    target_hits = {}
+    for name in TARGET_MULTIPLIERS['BUY']:
+        multiplier = np.where(is_long, TARGET_MULTIPLIERS['BUY'][name], TARGET_MULTIPLIERS['SELL'][name])
+        target_hits[name] = first_touch(multiplier, favourable=True)
+
+    exit_target = target_hits[target]
+    stopped = stop_first(exit_target, stop_hit)
+    took_profit = ~stopped & (exit_target >= 0)
+
+    exit_index = np.where(stopped, stop_hit, np.where(took_profit, exit_target, limits))
+    target_multiplier = np.where(is_long, TARGET_MULTIPLIERS['BUY'][target], TARGET_MULTIPLIERS['SELL'][target])
+    exit_price = np.where(
+        stopped, entry_price * stop_multiplier,
+        np.where(took_profit, entry_price * target_multiplier, close[exit_index])
+    )
+    exit_reason = np.where(stopped, 'stop', np.where(took_profit, 'target', 'timeout'))
+
+    # Keep only trades that start after the previous one closed. This loops
+    # once per trade taken, not once per bar.
+    if not overlapping and len(candidates):
+        selected = []
+        i = 0
+        while i < len(candidates):
+            selected.append(i)
+            i = np.searchsorted(candidates, exit_index[i], side='right')
+        keep = np.array(selected)
+    else:
+        keep = np.arange(len(candidates))
+
+    direction = np.where(is_long, 1.0, -1.0)[keep]
+    entry_price = entry_price[keep]
+    exit_price = exit_price[keep]
+    if position_size is None:
+        units = (margin * leverage) / entry_price
+    else:
+        units = np.full(len(keep), float(position_size))
+    pnl = direction * (exit_price - entry_price) * units * leverage
+
+    trades = {
+        'entry_index': candidates[keep],
+        'exit_index': exit_index[keep],
+        'direction': direction,
+        'entry_price': entry_price,
+        'exit_price': exit_price,
+        'exit_reason': exit_reason[keep],
+        'pnl': pnl,
+        'roi': (pnl / margin) * 100,
+    }
+    for name, hits in target_hits.items():
+        trades[f'hit_{name}'] = (hits >= 0)[keep] & ~stop_first(hits, stop_hit)[keep]
+    return trades
+
+
+def summarize(trades, margin=1000):
+    """Aggregate per-trade results into P&L, hit rates and drawdown"""
+    pnl = trades['pnl']
+    count = len(pnl)
+
+    equity = margin + np.concatenate([[0.0], np.cumsum(pnl)])
+    peaks = np.maximum.accumulate(equity)
+    drawdown = peaks - equity
+    worst = int(np.argmax(drawdown)) if count else 0
+
+    return {
+        'trades': count,
+        'total_pnl': float(pnl.sum()),
+        'avg_pnl': float(pnl.mean()) if count else 0.0,
+        'win_rate': float((pnl > 0).mean() * 100) if count else 0.0,
+        'hit_rates': {
+            name: float(trades[f'hit_{name}'].mean() * 100) if count else 0.0
+            for name in TARGET_MULTIPLIERS['BUY']
+        },
+        'stop_rate': float((trades['exit_reason'] == 'stop').mean() * 100) if count else 0.0,
+        'max_drawdown': float(drawdown.max()),
+        'max_drawdown_pct': float(drawdown[worst] / peaks[worst] * 100) if count else 0.0,
+        'final_equity': float(equity[-1]),
+    }
+
+
+class Backtester:
+    """
+    Backtest the strategy's BUY/SELL signals on historical OHLCV data
+
+    Signals come from TradingStrategy.score_history() unless given, and
+    exits are resolved with array operations (see simulate()).
+    """
+
+    def __init__(self, df, signals=None, margin=1000, leverage=1, position_size=None):
+        self.df = df
+        self.margin = margin
+        self.leverage = leverage
+        self.position_size = position_size
+
+        if signals is None:
+            indicators = TechnicalIndicators(df).calculate_all()
+            signals = TradingStrategy(df, indicators).score_history()['signal']
+        self.signals = np.asarray(signals)
+
+    def run(self, target='5%', max_holding=None, overlapping=False):
+        """
+        Run the backtest
+
+        Returns:
+            Dictionary with the summary metrics from summarize() plus a
+            'trade_log' DataFrame indexed by entry time
+        """
+        trades = simulate(
+            self.df['High'], self.df['Low'], self.df['Close'], self.signals,
+            margin=self.margin, leverage=self.leverage, position_size=self.position_size,
+            target=target, max_holding=max_holding, overlapping=overlapping
+        )
+
+        trade_log = pd.DataFrame(trades, index=self.df.index[trades['entry_index']])
+        trade_log['exit_time'] = self.df.index[trades['exit_index']]
+        trade_log['signal'] = np.where(trades['direction'] > 0, 'BUY', 'SELL')
+
+        results = summarize(trades, self.margin)
+        results['trade_log'] = trade_log
+        return results
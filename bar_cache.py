@@ -0,0 +1,209 @@
+import os
+import pickle
+import re
+import tempfile
+import time
+from datetime import timedelta
+
+import pandas as pd
+
+# Seconds a cached series is served without asking the source for new bars,
+# scaled to how quickly each interval's forming candle goes stale. Callers
+# that must see the newest candle regardless (the live poller, a manual
+# refresh) call BarCache.expire() instead of relying on a short TTL.
+DEFAULT_TTLS = {
+    '1m': 30,
+    '2m': 30,
+    '5m': 60,
+    '15m': 60,
+    '30m': 60,
+    '60m': 60,
+    '90m': 60,
+    '1h': 60,
+    '1d': 300,
+    '5d': 900,
+    '1wk': 6 * 3600,
+    '1mo': 24 * 3600,
+    '3mo': 24 * 3600,
+}
+
+# Yahoo Finance only serves intraday bars this far back; a delta fetch that
+# would start earlier is replaced by a full fetch
+LOOKBACK_LIMITS = {
+    '1m': timedelta(days=7),
+    '2m': timedelta(days=60),
+    '5m': timedelta(days=60),
+    '15m': timedelta(days=60),
+    '30m': timedelta(days=60),
+    '60m': timedelta(days=730),
+    '90m': timedelta(days=60),
+    '1h': timedelta(days=730),
+}
+
+# Calendar length of the yfinance period strings (None = whole history)
+PERIOD_LENGTHS = {
+    '1d': timedelta(days=1),
+    '5d': timedelta(days=5),
+    '7d': timedelta(days=7),
+    '60d': timedelta(days=60),
+    '1mo': timedelta(days=31),
+    '3mo': timedelta(days=92),
+    '6mo': timedelta(days=183),
+    '1y': timedelta(days=366),
+    '2y': timedelta(days=731),
+    '5y': timedelta(days=1827),
+    '10y': timedelta(days=3653),
+    'max': None,
+}
+
+
+def period_length(period):
+    if period in PERIOD_LENGTHS:
+        return PERIOD_LENGTHS[period]
+    match = re.fullmatch(r'(\d+)d', period)
+    if match:
+        return timedelta(days=int(match.group(1)))
+    return None
+
+
+class BarCache:
+    """
+    On-disk OHLCV cache keyed by symbol and interval
+
+    A fresh entry (younger than the interval's TTL) is returned as is. A stale
+    entry is topped up by fetching only the bars from the last cached
+    timestamp onward, so the newest (possibly still forming) candle is
+    refreshed and the rest of the history is reused. expire() marks entries
+    stale ahead of their TTL. Files are evicted least recently used first
+    once the cache grows past max_bytes.
+    """
+
+    def __init__(self, cache_dir='.bar_cache', ttls=None, max_bytes=200 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.max_bytes = max_bytes
+        self._expired = set()
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, symbol, interval):
+        safe_symbol = re.sub(r'[^A-Za-z0-9._-]', '_', symbol)
+        return os.path.join(self.cache_dir, f'{safe_symbol}__{interval}.pkl')
+
+    def expire(self, symbol, interval=None):
+        """Make the next get() of the symbol (one interval, or all) top up its bars"""
+        for name in [interval] if interval else list(self.ttls):
+            self._expired.add(self._path(symbol, name))
+
+    def _load(self, path):
+        try:
+            with open(path, 'rb') as f:
+                entry = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            return None
+        os.utime(path)  # mark as recently used for eviction
+        return entry
+
+    def _save(self, path, entry):
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _covers(self, cached_period, period):
+        """Whether bars cached for `cached_period` include everything in `period`"""
+        cached_length = period_length(cached_period)
+        length = period_length(period)
+        if cached_length is None:
+            return cached_period == 'max' or cached_period == period
+        return length is not None and length <= cached_length
+
+    def _can_delta_fetch(self, interval, last_timestamp):
+        limit = LOOKBACK_LIMITS.get(interval)
+        if limit is None:
+            return True
+        now = pd.Timestamp.now(tz=last_timestamp.tz)
+        return now - last_timestamp < limit
+
+    @staticmethod
+    def _trim(bars, period):
+        length = period_length(period)
+        if length is None or bars.empty:
+            return bars
+        return bars[bars.index >= bars.index[-1] - length]
+
+    def get(self, symbol, period, interval, fetch):
+        """
+        Bars for symbol/period/interval, fetching only what is missing
+
+        Args:
+            symbol: Instrument symbol
+            period: yfinance period string ('7d', '3mo', '1y', ...)
+            interval: yfinance interval string ('1m', '1h', '1d', ...)
+            fetch: Callable fetch(period=None, start=None) returning an OHLCV
+                   DataFrame, called with either a period (full fetch) or a
+                   start timestamp (delta fetch)
+
+        Returns:
+            OHLCV DataFrame (empty results are returned but not cached)
+        """
+        path = self._path(symbol, interval)
+        entry = self._load(path)
+
+        if entry is not None and self._covers(entry['period'], period) and not entry['bars'].empty:
+            bars = entry['bars']
+            if path not in self._expired and time.time() - entry['fetched_at'] < self.ttls.get(interval, 0):
+                return self._trim(bars, period)
+            self._expired.discard(path)
+
+            last_timestamp = bars.index[-1]
+            if self._can_delta_fetch(interval, last_timestamp):
+                new_bars = fetch(start=last_timestamp)
+                if new_bars is not None and not new_bars.empty:
+                    bars = pd.concat([bars, new_bars])
+                    bars = bars[~bars.index.duplicated(keep='last')].sort_index()
+                bars = self._trim(bars, entry['period'])
+                self._save(path, {'bars': bars, 'period': entry['period'], 'fetched_at': time.time()})
+                self._evict()
+                return self._trim(bars, period)
+
+        bars = fetch(period=period)
+        if bars is None or bars.empty:
+            return bars
+
+        self._save(path, {'bars': bars, 'period': period, 'fetched_at': time.time()})
+        self._evict()
+        return bars
+
+    def _evict(self):
+        """Delete least recently used files until the cache fits in max_bytes"""
+        files = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith('.pkl'):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+
+    def clear(self):
+        """Remove every cached file"""
+        for name in os.listdir(self.cache_dir):
+            if name.endswith('.pkl'):
+                os.remove(os.path.join(self.cache_dir, name))
@@ -0,0 +1,153 @@
+"""
+Per-rerun database latency: connection per call vs the pooled Database
+
+Replays what one dashboard rerun does against the database (sidebar
+history read, statistics, one insert) and compares the old pattern of
+opening a fresh sqlite3 connection for every call with the long-lived,
+WAL-mode connections of Database.
+
+Usage:
+    python benchmarks/bench_database.py [--reruns 500] [--threads 8]
+"""
+import argparse
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database import Database  # noqa: E402
+
+ROW = ('GC=F', 'BUY', 2000.0, 2060.0, 2100.0, 2200.0, 1960.0, 42.0, '{}')
+
+# The recommendations table as database.py created it before the pooled
+# Database: rollback journal, no indexes, no statistics triggers
+LEGACY_SCHEMA = '''
+    CREATE TABLE IF NOT EXISTS recommendations (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+        symbol TEXT NOT NULL,
+        signal TEXT NOT NULL,
+        entry_price REAL NOT NULL,
+        target_3 REAL,
+        target_5 REAL,
+        target_10 REAL,
+        stop_loss REAL,
+        confidence REAL,
+        indicators TEXT
+    )
+'''
+
+
+def create_legacy(db_path):
+    """Create the legacy database with a plain sqlite3 connection"""
+    conn = sqlite3.connect(db_path)
+    conn.execute(LEGACY_SCHEMA)
+    conn.commit()
+    conn.close()
+
+
+def legacy_rerun(db_path):
+    """One rerun with a fresh connection per call, statements as database.py used to run them"""
+    # get_recent_recommendations(5)
+    conn = sqlite3.connect(db_path)
+    pd.read_sql_query('''
+        SELECT * FROM recommendations 
+        ORDER BY timestamp DESC 
+        LIMIT 5
+    ''', conn)
+    conn.close()
+
+    # get_statistics()
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+    cursor.execute('SELECT COUNT(*) FROM recommendations')
+    cursor.fetchone()
+    cursor.execute('SELECT signal, COUNT(*) FROM recommendations GROUP BY signal')
+    cursor.fetchall()
+    cursor.execute('SELECT AVG(confidence) FROM recommendations')
+    cursor.fetchone()
+    conn.close()
+
+    # add_recommendation(...), including the keep-last-100 trim
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+    cursor.execute('''
+        INSERT INTO recommendations 
+        (symbol, signal, entry_price, target_3, target_5, target_10, 
+         stop_loss, confidence, indicators)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ''', ROW)
+    conn.commit()
+    cursor.execute('''
+        DELETE FROM recommendations 
+        WHERE id NOT IN (
+            SELECT id FROM recommendations 
+            ORDER BY timestamp DESC 
+            LIMIT 100
+        )
+    ''')
+    conn.commit()
+    conn.close()
+
+
+def pooled_rerun(db):
+    """The same rerun through Database"""
+    db.get_recent_recommendations(5)
+    db.get_statistics()
+    db.add_recommendation(*ROW)
+
+
+def timed(func, reruns, threads):
+    """Run `reruns` reruns split over `threads` threads; return (seconds, per-rerun latencies)"""
+    latencies = []
+    lock = threading.Lock()
+
+    def worker(count):
+        local = []
+        for _ in range(count):
+            start = time.perf_counter()
+            func()
+            local.append(time.perf_counter() - start)
+        with lock:
+            latencies.extend(local)
+
+    start = time.perf_counter()
+    workers = [threading.Thread(target=worker, args=(reruns // threads,)) for _ in range(threads)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    return time.perf_counter() - start, sorted(latencies)
+
+
+def report(name, elapsed, latencies):
+    p50 = latencies[len(latencies) // 2] * 1000
+    p95 = latencies[int(len(latencies) * 0.95)] * 1000
+    print(f"{name:<22} total {elapsed:7.3f}s   p50 {p50:7.3f} ms   p95 {p95:7.3f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--reruns', type=int, default=500)
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 8])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for threads in args.threads:
+            legacy_path = os.path.join(tmp, f'legacy_{threads}.db')
+            create_legacy(legacy_path)
+            report(f'connect per call x{threads}', *timed(lambda: legacy_rerun(legacy_path), args.reruns, threads))
+
+            db = Database(os.path.join(tmp, f'pooled_{threads}.db'))
+            report(f'pooled Database x{threads}', *timed(lambda: pooled_rerun(db), args.reruns, threads))
+            db.close()
+
+
+if __name__ == '__main__':
+    main()
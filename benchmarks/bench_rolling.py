@@ -0,0 +1,76 @@
+"""
+Benchmark the NumPy rolling kernels against the pandas code they replaced
+
+Usage:
+    python benchmarks/bench_rolling.py
+    python benchmarks/bench_rolling.py --sizes 10000 100000 1000000 --legacy-limit 100000
+
+The legacy CCI path calls a Python lambda once per bar, so at large sizes it
+is timed on the first --legacy-limit bars and extrapolated linearly.
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rolling import rolling_max, rolling_min, rolling_mean_abs_deviation  # noqa: E402
+
+
+def best_of(func, repeat=3):
+    """Return the fastest wall-clock time of several runs"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def legacy_mad(values, window):
+    return pd.Series(values).rolling(window=window).apply(lambda x: np.abs(x - x.mean()).mean())
+
+
+def run(sizes, window=20, legacy_limit=100_000):
+    rng = np.random.default_rng(42)
+    rows = []
+
+    for size in sizes:
+        values = 100 + np.cumsum(rng.normal(0, 1, size))
+        series = pd.Series(values)
+
+        # Mean absolute deviation (CCI)
+        legacy_size = min(size, legacy_limit)
+        legacy = best_of(lambda: legacy_mad(values[:legacy_size], window), repeat=1)
+        legacy *= size / legacy_size
+        kernel = best_of(lambda: rolling_mean_abs_deviation(values, window))
+        rows.append(('mean_abs_deviation', size, legacy, kernel, legacy_size < size))
+
+        # Rolling min/max (Stochastic, Williams %R)
+        legacy = best_of(lambda: (series.rolling(14).min(), series.rolling(14).max()))
+        kernel = best_of(lambda: (rolling_min(values, 14), rolling_max(values, 14)))
+        rows.append(('rolling_min_max', size, legacy, kernel, False))
+
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+    parser.add_argument('--legacy-limit', type=int, default=100_000,
+                        help='Largest input the per-bar lambda is actually run on')
+    args = parser.parse_args()
+
+    print(f"{'kernel':<20} {'bars':>10} {'pandas (s)':>12} {'numpy (s)':>12} {'speedup':>10}")
+    for name, size, legacy, kernel, estimated in run(args.sizes, legacy_limit=args.legacy_limit):
+        marker = '*' if estimated else ' '
+        print(f"{name:<20} {size:>10,} {legacy:>11.4f}{marker} {kernel:>12.4f} {legacy / kernel:>9.1f}x")
+    print("* extrapolated from --legacy-limit bars")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+"""
+Cold-start import-time budget
+
+Imports each entry point in fresh interpreters and fails (exit status 1)
+when an import raises, when the median import time exceeds its budget,
+or when a module that should load lazily (Plotly, yfinance, ...) is
+already imported at startup.
+Run it in CI or before deploying to catch start-up regressions.
+
+Usage:
+    python benchmarks/check_import_time.py [--runs 5] [--scale 1.0] [--top 10]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Seconds allowed for `import <module>` (median over the runs)
+BUDGETS = {
+    'signal_service': 1.0,
+    'app': 3.0,
+}
+
+# Modules that must not be imported by the entry point itself
+LAZY_MODULES = {
+    'signal_service': ['streamlit', 'plotly', 'yfinance'],
+    'app': ['plotly', 'yfinance'],
+}
+
+PROBE = '''
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{'seconds': elapsed,
+                  'loaded': [name for name in {lazy!r} if name in sys.modules]}}))
+'''
+
+
+def measure(module, lazy, top=0):
+    """Import `module` in a fresh interpreter; returns (seconds, eagerly loaded lazy modules, top imports)"""
+    env = {**os.environ, 'PYTHONPATH': ROOT + os.pathsep + os.environ.get('PYTHONPATH', '')}
+    command = [sys.executable]
+    if top:
+        command += ['-X', 'importtime']
+    command += ['-c', PROBE.format(module=module, lazy=lazy)]
+
+    # Run from a scratch directory: importing app creates its database and cache there
+    with tempfile.TemporaryDirectory() as cwd:
+        result = subprocess.run(command, cwd=cwd, env=env, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else 'failed')
+
+    report = json.loads(result.stdout.strip().splitlines()[-1])
+    slowest = []
+    if top:
+        for line in result.stderr.splitlines():
+            if line.startswith('import time:') and not line.endswith('| imported package'):
+                _, cumulative, name = line[len('import time:'):].split('|')
+                if cumulative.strip().isdigit():
+                    slowest.append((int(cumulative), name.strip()))
+        slowest = sorted(slowest, reverse=True)[:top]
+    return report['seconds'], report['loaded'], slowest
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--scale', type=float, default=1.0,
+                        help='Multiply every budget (e.g. 2 on slow CI machines)')
+    parser.add_argument('--top', type=int, default=0,
+                        help='Also list the N slowest imports (cumulative) of each entry point')
+    parser.add_argument('modules', nargs='*', default=list(BUDGETS))
+    args = parser.parse_args()
+
+    failed = False
+    for module in args.modules:
+        budget = BUDGETS.get(module, 1.0) * args.scale
+        lazy = LAZY_MODULES.get(module, [])
+        try:
+            runs = [measure(module, lazy) for _ in range(args.runs)]
+        except RuntimeError as e:
+            # An entry point that cannot even be imported is a failure, not a skip
+            print(f"{module:<16} import failed  FAIL ({e})")
+            failed = True
+            continue
+
+        seconds = statistics.median(run[0] for run in runs)
+        loaded = sorted({name for run in runs for name in run[1]})
+        ok = seconds <= budget and not loaded
+        failed |= not ok
+        print(f"{module:<16} {seconds * 1000:8.1f} ms  budget {budget * 1000:8.1f} ms  "
+              f"{'ok' if ok else 'FAIL'}")
+        if loaded:
+            print(f"{'':<16} imported at startup but should be lazy: {', '.join(loaded)}")
+
+        if args.top:
+            for microseconds, name in measure(module, lazy, args.top)[2]:
+                print(f"{'':<16} {microseconds / 1000:8.1f} ms  {name}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""
+Check the vectorized score_history against generate_signal bar by bar
+
+For every bar of a few synthetic histories, runs the scalar
+TradingStrategy.generate_signal on the history truncated at that bar and
+compares its total score, signal and confidence with the matching entry of
+TradingStrategy.score_history. One history gets a run of volume spikes so
+the volume rules fire. Exits with status 1 on any mismatch.
+
+Usage:
+    python benchmarks/check_score_history.py [--bars 700] [--seeds 3]
+"""
+import argparse
+import contextlib
+import io
+import math
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_sources import SyntheticProvider  # noqa: E402
+from indicators import TechnicalIndicators  # noqa: E402
+from strategy import TradingStrategy  # noqa: E402
+
+
+def compare(df, tolerance):
+    """Bars where generate_signal and score_history disagree, as (bar, scalar, vectorized)"""
+    indicators = TechnicalIndicators(df).calculate_all()
+    history = TradingStrategy(df, indicators).score_history()
+
+    mismatched = []
+    # generate_signal prints its category scores; keep the report readable
+    with contextlib.redirect_stdout(io.StringIO()):
+        for i in range(1, len(df)):
+            truncated = {name: values.iloc[:i + 1] for name, values in indicators.items()}
+            scalar = TradingStrategy(df.iloc[:i + 1], truncated).generate_signal()
+            vectorized = (float(history['score'][i]), str(history['signal'][i]),
+                          float(history['confidence'][i]))
+            if (scalar['signal'] != vectorized[1]
+                    or not math.isclose(scalar['total_score'], vectorized[0], rel_tol=tolerance, abs_tol=tolerance)
+                    or not math.isclose(scalar['confidence'], vectorized[2], rel_tol=tolerance, abs_tol=tolerance)):
+                mismatched.append((i, (scalar['total_score'], scalar['signal'], scalar['confidence']), vectorized))
+    return mismatched
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--bars', type=int, default=700)
+    parser.add_argument('--seeds', type=int, default=3)
+    parser.add_argument('--tolerance', type=float, default=1e-9)
+    args = parser.parse_args()
+
+    failed = False
+    for seed in range(args.seeds):
+        df = SyntheticProvider(bars=args.bars, seed=seed).get_history('CHECK', interval='1h')
+        if seed == 1:
+            spikes = slice(len(df) * 3 // 7, len(df) * 3 // 7 + 30)
+            df.iloc[spikes, df.columns.get_loc('Volume')] *= 5
+
+        mismatched = compare(df, args.tolerance)
+        failed |= bool(mismatched)
+        print(f"seed {seed:<3} {len(df):,} bars  {len(mismatched)} mismatch(es)  "
+              f"{'FAIL' if mismatched else 'ok'}")
+        for i, scalar, vectorized in mismatched[:10]:
+            print(f"{'':<9} bar {i}: generate_signal {scalar} != score_history {vectorized}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,230 @@
+"""
+Benchmark suite for the dashboard's hot paths
+
+Times every TechnicalIndicators.calculate_* method, calculate_all,
+TradingStrategy.generate_signal, the Database insert and read paths and
+both chart builders on synthetic OHLCV series of each requested length.
+Results can be saved as a JSON baseline and later runs compared against
+it; the comparison exits with status 1 when any benchmark got slower than
+the allowed ratio.
+
+Usage:
+    python benchmarks/run.py                                   # 1k, 100k and 1M bars
+    python benchmarks/run.py --sizes 1000 100000 --save benchmarks/baseline.json
+    python benchmarks/run.py --compare benchmarks/baseline.json --threshold 1.5
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_sources import SyntheticProvider  # noqa: E402
+from database import Database  # noqa: E402
+from indicators import TechnicalIndicators  # noqa: E402
+from strategy import TradingStrategy  # noqa: E402
+
+# Arguments for calculate_* methods without defaults
+CALCULATE_ARGS = {
+    'calculate_sma': (20,),
+    'calculate_ema': (12,),
+}
+
+# Timings below this many seconds are too noisy to flag as regressions
+NOISE_FLOOR = 0.001
+
+
+def timed(func, repeat):
+    """Run func `repeat` times; returns (min, median) wall-clock seconds"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times), statistics.median(times)
+
+
+def quiet(func):
+    """func with stdout discarded (the strategy prints its scores)"""
+    def run():
+        with contextlib.redirect_stdout(io.StringIO()):
+            return func()
+    return run
+
+
+def indicator_cases(df):
+    ti = TechnicalIndicators(df)
+    for name in sorted(dir(ti)):
+        if name.startswith('calculate_') and name != 'calculate_all':
+            method = getattr(ti, name)
+            args = CALCULATE_ARGS.get(name, ())
+            yield f'indicators.{name}', lambda method=method, args=args: method(*args)
+    yield 'indicators.calculate_all', lambda: TechnicalIndicators(df).calculate_all()
+    yield 'indicators.calculate_all_last_value', \
+        lambda: dict(TechnicalIndicators(df).calculate_all(last_value=True))
+
+
+def strategy_cases(df):
+    indicators = TechnicalIndicators(df).calculate_all()
+    yield 'strategy.generate_signal', \
+        quiet(lambda: TradingStrategy(df, indicators).generate_signal(1000, 20, 1))
+
+
+def database_cases(df, rows, directory, cleanup):
+    """
+    Database benchmarks on files under `directory`; the main database is
+    closed through the `cleanup` ExitStack once the cases have run
+    """
+    close = df['Close'].to_numpy()[:rows]
+    recommendations = [{
+        'symbol': f'SYM{i % 20}',
+        'signal': 'BUY' if i % 2 else 'SELL',
+        'entry_price': float(price),
+        'target_3': float(price) * 1.03,
+        'target_5': float(price) * 1.05,
+        'target_10': float(price) * 1.10,
+        'stop_loss': float(price) * 0.98,
+        'confidence': 50.0,
+        'indicators': {'RSI': 1, 'MACD': -1, 'Volatility': 'Normal'},
+    } for i, price in enumerate(close)]
+
+    directory = tempfile.mkdtemp(dir=directory)
+    db = Database(os.path.join(directory, 'bench.db'), max_rows=None)
+    cleanup.callback(db.close)
+    db.add_recommendations(recommendations)
+    batch_path = os.path.join(directory, 'batch.db')
+
+    def insert_one():
+        db.add_recommendation(**recommendations[0])
+
+    def insert_batch():
+        # Every repeat starts from an empty file at the same path
+        for suffix in ('', '-wal', '-shm'):
+            if os.path.exists(batch_path + suffix):
+                os.remove(batch_path + suffix)
+        scratch = Database(batch_path, max_rows=None)
+        try:
+            scratch.add_recommendations(recommendations)
+        finally:
+            scratch.close()
+
+    yield 'database.add_recommendation', insert_one
+    yield f'database.add_recommendations[{rows}]', insert_batch
+    yield 'database.get_recent_recommendations', lambda: db.get_recent_recommendations(10)
+    yield 'database.find_recommendations', \
+        lambda: db.find_recommendations(signal='BUY', indicator='RSI', value=1)
+    yield f'database.iter_recommendations[{rows}]', \
+        lambda: sum(len(chunk) for chunk in db.iter_recommendations(chunk_size=5000))
+    yield 'database.get_statistics', db.get_statistics
+
+
+def chart_cases(df):
+    try:
+        from charts import create_candlestick_chart, create_indicators_chart
+    except ImportError as e:
+        print(f"   (charts skipped: {e})")
+        return
+    indicators = TechnicalIndicators(df).calculate_all()
+    yield 'charts.create_candlestick_chart', lambda: create_candlestick_chart(df, 'BENCH')
+    yield 'charts.create_indicators_chart', lambda: create_indicators_chart(df, indicators)
+    yield 'charts.create_indicators_chart_webgl', \
+        lambda: create_indicators_chart(df, indicators, webgl=True)
+
+
+def run(sizes, repeat=5, max_db_rows=10_000, groups=('indicators', 'strategy', 'database', 'charts')):
+    results = {}
+    # Database files go in one scratch directory, removed when the run finishes
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            df = SyntheticProvider(bars=size, seed=42).get_history('BENCH', interval='1h')
+            # Large series are slow enough that fewer repeats still give stable minimums
+            runs = repeat if size < 1_000_000 else max(1, repeat // 3)
+            print(f"\n{size:,} bars")
+
+            # Closes the databases opened for this size once they are timed
+            with contextlib.ExitStack() as cleanup:
+                cases = []
+                if 'indicators' in groups:
+                    cases += indicator_cases(df)
+                if 'strategy' in groups:
+                    cases += strategy_cases(df)
+                if 'database' in groups:
+                    cases += database_cases(df, min(size, max_db_rows), directory, cleanup)
+                if 'charts' in groups:
+                    cases += chart_cases(df)
+
+                for name, func in cases:
+                    best, median = timed(func, runs)
+                    results[f'{name}@{size}'] = {'min': best, 'median': median, 'repeat': runs}
+                    print(f"   {name:<48} {best * 1000:10.2f} ms  (median {median * 1000:.2f} ms)")
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Print new vs baseline minimums; returns the names that regressed"""
+    regressions = []
+    print(f"\n{'benchmark':<60} {'baseline':>10} {'now':>10} {'ratio':>7}")
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        before, now = baseline[name]['min'], result['min']
+        ratio = now / before if before else float('inf')
+        regressed = ratio > threshold and now - before > NOISE_FLOOR
+        if regressed:
+            regressions.append(name)
+        print(f"{name:<60} {before * 1000:8.2f}ms {now * 1000:8.2f}ms {ratio:6.2f}x"
+              f"{'  REGRESSION' if regressed else ''}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1_000, 100_000, 1_000_000])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--max-db-rows', type=int, default=10_000,
+                        help='Cap on recommendation rows used by the database benchmarks')
+    parser.add_argument('--only', nargs='+', choices=['indicators', 'strategy', 'database', 'charts'],
+                        default=['indicators', 'strategy', 'database', 'charts'])
+    parser.add_argument('--save', help='Write the results to this JSON file')
+    parser.add_argument('--compare', help='Compare against a JSON file written by --save')
+    parser.add_argument('--threshold', type=float, default=1.5,
+                        help='Slowdown ratio counted as a regression (default: 1.5)')
+    args = parser.parse_args()
+
+    results = run(args.sizes, args.repeat, args.max_db_rows, args.only)
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump({
+                'created': datetime.now().isoformat(timespec='seconds'),
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'numpy': np.__version__,
+                'pandas': pd.__version__,
+                'results': results,
+            }, f, indent=2)
+        print(f"\nSaved {len(results)} results to {args.save}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)['results']
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) over {args.threshold:.2f}x")
+            sys.exit(1)
+        print("\nNo regressions")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,147 @@
+import numpy as np
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+from downsample import DEFAULT_MAX_POINTS, downsample_series, ohlc_buckets, visible_window
+
+
+def _line(series, df, max_points):
+    """Indicator series limited to the visible bars and LTTB-downsampled"""
+    return downsample_series(series.reindex(df.index), max_points)
+
+
+def create_candlestick_chart(df, symbol, max_points=DEFAULT_MAX_POINTS, bars=None):
+    """
+    Create candlestick chart with volume
+
+    Only the last `bars` bars are drawn (all by default), aggregated into at
+    most max_points OHLC candles, so the browser payload stays bounded.
+    """
+    candles = ohlc_buckets(visible_window(df, bars), max_points)
+
+    fig = make_subplots(
+        rows=2, cols=1,
+        shared_xaxes=True,
+        vertical_spacing=0.03,
+        subplot_titles=(f'{symbol} Price', 'Volume'),
+        row_heights=[0.7, 0.3]
+    )
+
+    # Candlestick
+    fig.add_trace(
+        go.Candlestick(
+            x=candles.index,
+            open=candles['Open'],
+            high=candles['High'],
+            low=candles['Low'],
+            close=candles['Close'],
+            name='Price'
+        ),
+        row=1, col=1
+    )
+
+    # Volume bars
+    colors = np.where(candles['Close'] < candles['Open'], 'red', 'green')
+    fig.add_trace(
+        go.Bar(x=candles.index, y=candles['Volume'], name='Volume', marker_color=colors),
+        row=2, col=1
+    )
+
+    fig.update_layout(
+        height=600,
+        showlegend=False,
+        xaxis_rangeslider_visible=False
+    )
+
+    fig.update_xaxes(title_text="Date", row=2, col=1)
+    fig.update_yaxes(title_text="Price", row=1, col=1)
+    fig.update_yaxes(title_text="Volume", row=2, col=1)
+
+    return fig
+
+
+def create_indicators_chart(df, indicators_data, max_points=DEFAULT_MAX_POINTS, bars=None,
+                            webgl=False):
+    """
+    Create technical indicators chart
+
+    Every line is limited to the last `bars` bars and reduced to at most
+    max_points points with LTTB. With webgl=True the lines are drawn with
+    Scattergl, which the browser renders on the GPU instead of as SVG paths.
+    """
+    df = visible_window(df, bars)
+    Scatter = go.Scattergl if webgl else go.Scatter
+
+    def line(name):
+        return _line(indicators_data[name], df, max_points)
+
+    fig = make_subplots(
+        rows=3, cols=1,
+        shared_xaxes=True,
+        vertical_spacing=0.05,
+        subplot_titles=('Price with Moving Averages', 'RSI', 'MACD'),
+        row_heights=[0.5, 0.25, 0.25]
+    )
+
+    # Price with MAs
+    close = downsample_series(df['Close'], max_points)
+    fig.add_trace(
+        Scatter(x=close.index, y=close, name='Close', line=dict(color='blue')),
+        row=1, col=1
+    )
+    for name, label, color, dash in [('SMA_20', 'SMA 20', 'orange', 'dash'),
+                                     ('SMA_50', 'SMA 50', 'red', 'dash'),
+                                     ('EMA_12', 'EMA 12', 'purple', 'dot')]:
+        series = line(name)
+        fig.add_trace(
+            Scatter(x=series.index, y=series, name=label, line=dict(color=color, dash=dash)),
+            row=1, col=1
+        )
+
+    # Bollinger Bands (one set of points for both bands so the fill lines up)
+    bb_upper = line('BB_upper')
+    bb_lower = indicators_data['BB_lower'].reindex(bb_upper.index)
+    fig.add_trace(
+        Scatter(x=bb_upper.index, y=bb_upper, name='BB Upper',
+                line=dict(color='gray', dash='dash'), opacity=0.5),
+        row=1, col=1
+    )
+    fig.add_trace(
+        Scatter(x=bb_lower.index, y=bb_lower, name='BB Lower',
+                line=dict(color='gray', dash='dash'), opacity=0.5,
+                fill='tonexty', fillcolor='rgba(128,128,128,0.2)'),
+        row=1, col=1
+    )
+
+    # RSI
+    rsi = line('RSI')
+    fig.add_trace(
+        Scatter(x=rsi.index, y=rsi, name='RSI', line=dict(color='purple')),
+        row=2, col=1
+    )
+    fig.add_hline(y=70, line_dash="dash", line_color="red", row=2, col=1)
+    fig.add_hline(y=30, line_dash="dash", line_color="green", row=2, col=1)
+
+    # MACD
+    macd = line('MACD')
+    macd_signal = line('MACD_signal')
+    macd_hist = line('MACD_hist')
+    fig.add_trace(
+        Scatter(x=macd.index, y=macd, name='MACD', line=dict(color='blue')),
+        row=3, col=1
+    )
+    fig.add_trace(
+        Scatter(x=macd_signal.index, y=macd_signal, name='Signal', line=dict(color='red')),
+        row=3, col=1
+    )
+    fig.add_trace(
+        go.Bar(x=macd_hist.index, y=macd_hist, name='Histogram'),
+        row=3, col=1
+    )
+
+    fig.update_layout(height=800, showlegend=True)
+    fig.update_yaxes(title_text="Price", row=1, col=1)
+    fig.update_yaxes(title_text="RSI", row=2, col=1)
+    fig.update_yaxes(title_text="MACD", row=3, col=1)
+
+    return fig
@@ -0,0 +1,256 @@
+import abc
+import os
+import zlib
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+
+from bar_cache import BarCache, period_length
+
+OHLCV_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume']
+
+# Bar length of the yfinance interval strings
+INTERVAL_LENGTHS = {
+    '1m': timedelta(minutes=1),
+    '2m': timedelta(minutes=2),
+    '5m': timedelta(minutes=5),
+    '15m': timedelta(minutes=15),
+    '30m': timedelta(minutes=30),
+    '60m': timedelta(hours=1),
+    '90m': timedelta(minutes=90),
+    '1h': timedelta(hours=1),
+    '1d': timedelta(days=1),
+    '5d': timedelta(days=5),
+    '1wk': timedelta(weeks=1),
+    '1mo': timedelta(days=30),
+    '3mo': timedelta(days=91),
+}
+
+
+class DataProvider(abc.ABC):
+    """Source of OHLCV bars for get_market_data"""
+
+    name = 'base'
+
+    @abc.abstractmethod
+    def get_history(self, symbol, period="3mo", interval="1d"):
+        """
+        Return an OHLCV DataFrame (Open, High, Low, Close, Volume) indexed by
+        timestamp, oldest bar first; empty if the symbol has no data
+        """
+
+    def expire(self, symbol, interval=None):
+        """Make the next get_history() of the symbol skip its cache TTL (no-op without a cache)"""
+
+
+class YahooProvider(DataProvider):
+    """Yahoo Finance bars via yfinance, through the on-disk bar cache"""
+
+    name = 'yahoo'
+
+    def __init__(self, cache=None):
+        self.cache = cache
+
+    def get_history(self, symbol, period="3mo", interval="1d"):
+        import yfinance as yf
+
+        ticker = yf.Ticker(symbol)
+        # Yahoo Finance limitations:
+        # 1m interval: max 7 days
+        # 5m interval: max 60 days
+        # 1h interval: max 730 days
+        # 1d interval: unlimited
+
+        # Adjust period/interval combination based on Yahoo Finance limits
+        if interval == "1m":
+            period = "7d"  # 1-minute data only available for last 7 days
+        elif interval == "5m":
+            period = "60d" if period in ["3mo", "6mo", "1y"] else period
+
+        def fetch(**kwargs):
+            return ticker.history(interval=interval, **kwargs)
+
+        if self.cache is None:
+            return fetch(period=period)
+        return self.cache.get(symbol, period, interval, fetch)
+
+    def expire(self, symbol, interval=None):
+        if self.cache is not None:
+            self.cache.expire(symbol, interval)
+
+
+class FileReplayProvider(DataProvider):
+    """
+    Bars read from local CSV or Parquet files
+
+    Looks for <symbol>_<interval>.csv/.parquet (then <symbol>.csv/.parquet)
+    in `directory`, with a timestamp index column and OHLCV columns. With
+    `step` set, the file is replayed like a live feed: the first call returns
+    the first `start_bars` bars and every later call reveals `step` more.
+    """
+
+    name = 'replay'
+
+    def __init__(self, directory, step=None, start_bars=500):
+        self.directory = directory
+        self.step = step
+        self.start_bars = start_bars
+        self._frames = {}
+        self._cursors = {}
+
+    def _file_path(self, symbol, interval):
+        safe_symbol = symbol.replace('/', '_')
+        for stem in (f'{safe_symbol}_{interval}', safe_symbol):
+            for extension in ('.parquet', '.csv'):
+                path = os.path.join(self.directory, stem + extension)
+                if os.path.exists(path):
+                    return path
+        return None
+
+    def _load(self, symbol, interval):
+        key = (symbol, interval)
+        if key not in self._frames:
+            path = self._file_path(symbol, interval)
+            if path is None:
+                self._frames[key] = pd.DataFrame(columns=OHLCV_COLUMNS)
+            elif path.endswith('.parquet'):
+                self._frames[key] = pd.read_parquet(path)
+            else:
+                self._frames[key] = pd.read_csv(path, index_col=0, parse_dates=True)
+            self._frames[key] = self._frames[key].sort_index()
+        return self._frames[key]
+
+    def get_history(self, symbol, period="3mo", interval="1d"):
+        bars = self._load(symbol, interval)
+
+        if self.step is not None:
+            key = (symbol, interval)
+            cursor = self._cursors.get(key, self.start_bars - self.step) + self.step
+            self._cursors[key] = min(cursor, len(bars))
+            bars = bars.iloc[:self._cursors[key]]
+
+        length = period_length(period)
+        if length is not None and not bars.empty:
+            bars = bars[bars.index >= bars.index[-1] - length]
+        return bars
+
+
+class SyntheticProvider(DataProvider):
+    """
+    Deterministic geometric Brownian motion bars
+
+    The same symbol, interval, seed and size always give the same bars, so
+    indicator and strategy runs are reproducible without any network access.
+    `bars` fixes the number of bars; otherwise it follows period/interval.
+    """
+
+    name = 'synthetic'
+
+    def __init__(self, bars=None, seed=0, start_price=100.0, drift=0.05, volatility=0.2,
+                 end='2025-01-01'):
+        self.bars = bars
+        self.seed = seed
+        self.start_price = start_price
+        self.drift = drift
+        self.volatility = volatility
+        self.end = pd.Timestamp(end, tz='UTC')
+
+    def _bar_count(self, period, interval):
+        if self.bars is not None:
+            return self.bars
+        length = period_length(period) or timedelta(days=3653)
+        return max(1, int(length / INTERVAL_LENGTHS.get(interval, timedelta(days=1))))
+
+    def get_history(self, symbol, period="3mo", interval="1d"):
+        count = self._bar_count(period, interval)
+        step = INTERVAL_LENGTHS.get(interval, timedelta(days=1))
+        rng = np.random.default_rng([self.seed, zlib.crc32(f'{symbol}|{interval}'.encode())])
+
+        # Log-normal price path, with dt measured in years
+        dt = step / timedelta(days=365)
+        log_returns = rng.normal(
+            (self.drift - self.volatility ** 2 / 2) * dt,
+            self.volatility * np.sqrt(dt),
+            count,
+        )
+        close = self.start_price * np.exp(np.cumsum(log_returns))
+        open_ = np.concatenate([[self.start_price], close[:-1]])
+
+        # Wicks extend beyond the body by a fraction of the bar's volatility
+        wick = np.abs(rng.normal(0, self.volatility * np.sqrt(dt) / 2, (2, count)))
+        high = np.maximum(open_, close) * (1 + wick[0])
+        low = np.minimum(open_, close) * (1 - wick[1])
+        volume = np.round(rng.lognormal(10, 0.5, count))
+
+        index = pd.date_range(end=self.end, periods=count, freq=step)
+        return pd.DataFrame(
+            {'Open': open_, 'High': high, 'Low': low, 'Close': close, 'Volume': volume},
+            index=index,
+        )
+
+
+def get_provider(name=None):
+    """
+    Build the data provider selected by `name` or the MARKET_DATA_PROVIDER
+    environment variable: 'yahoo' (default), 'replay' or 'synthetic'
+
+    Options come from the environment as well:
+        MARKET_DATA_DIR    directory of files for 'replay' (default: data)
+        MARKET_DATA_STEP   bars revealed per call when replaying (default: all)
+        MARKET_DATA_SEED   random seed for 'synthetic' (default: 0)
+        MARKET_DATA_BARS   bars per series for 'synthetic' (default: from period)
+    """
+    name = (name or os.environ.get('MARKET_DATA_PROVIDER', 'yahoo')).lower()
+
+    if name == 'yahoo':
+        return YahooProvider(cache=BarCache())
+    if name == 'replay':
+        step = os.environ.get('MARKET_DATA_STEP')
+        return FileReplayProvider(
+            os.environ.get('MARKET_DATA_DIR', 'data'),
+            step=int(step) if step else None,
+        )
+    if name == 'synthetic':
+        bars = os.environ.get('MARKET_DATA_BARS')
+        return SyntheticProvider(
+            bars=int(bars) if bars else None,
+            seed=int(os.environ.get('MARKET_DATA_SEED', 0)),
+        )
+    raise ValueError(f"Unknown market data provider: {name}")
+
+
+def get_market_data(symbol, period="3mo", interval="1d", provider=None, fetch=None,
+                    warn=print, error=print):
+    """
+    Bars for a symbol, falling back to one year of daily bars when the
+    requested period/interval returns nothing
+
+    Args:
+        provider: DataProvider to use (default: get_provider())
+        fetch: Callable fetch(symbol, period, interval) used instead of the
+               provider, e.g. a cached or polled fetch in front of it
+        warn: Called with the message when falling back to daily bars
+        error: Called with the message when fetching fails
+
+    Returns:
+        OHLCV DataFrame, or None if fetching raised
+    """
+    if fetch is None:
+        provider = provider or get_provider()
+
+        def fetch(symbol, period, interval):
+            return provider.get_history(symbol, period=period, interval=interval)
+
+    try:
+        df = fetch(symbol, period, interval)
+
+        if df is None or df.empty:
+            warn(f"No data returned for {symbol}. Trying with daily data...")
+            # Fallback to daily data
+            df = fetch(symbol, "1y", "1d")
+
+        return df
+    except Exception as e:
+        error(f"Error fetching data: {e}")
+        return None
@@ -1,138 +1,677 @@
 import sqlite3
+import ast
+import atexit
+import json
+import queue
+import threading
+import time
+from contextlib import contextmanager
 import pandas as pd
 from datetime import datetime
 import os
 
+def parse_indicators(indicators):
+    """Indicator breakdown as a dict, from a dict, JSON text or a legacy Python repr"""
+    if indicators is None:
+        return {}
+    if isinstance(indicators, dict):
+        return indicators
+    try:
+        parsed = json.loads(indicators)
+    except (TypeError, ValueError):
+        try:
+            parsed = ast.literal_eval(indicators)
+        except (ValueError, SyntaxError):
+            return {}
+    return parsed if isinstance(parsed, dict) else {}
+
+
+def _signal_rows(recommendation_id, indicators):
+    """recommendation_signals rows: numeric values go to `value`, labels to `label`"""
+    rows = []
+    for name, value in indicators.items():
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            rows.append((recommendation_id, name, float(value), None))
+        else:
+            rows.append((recommendation_id, name, None, str(value)))
+    return rows
+
+
+# Columns of the recommendations table, in table order
+RECOMMENDATION_COLUMNS = ['id', 'timestamp', 'symbol', 'signal', 'entry_price', 'target_3',
+                          'target_5', 'target_10', 'stop_loss', 'confidence', 'indicators']
+
+
+def _projection(columns):
+    """SELECT list for the requested columns; the (timestamp, id) page key is always included"""
+    if columns is None:
+        return ', '.join(RECOMMENDATION_COLUMNS)
+    unknown = [column for column in columns if column not in RECOMMENDATION_COLUMNS]
+    if unknown:
+        raise ValueError(f"Unknown recommendation column(s): {', '.join(unknown)}")
+    wanted = set(columns) | {'id', 'timestamp'}
+    return ', '.join(column for column in RECOMMENDATION_COLUMNS if column in wanted)
+
+
+def _create_recommendations(conn):
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS recommendations (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+            symbol TEXT NOT NULL,
+            signal TEXT NOT NULL,
+            entry_price REAL NOT NULL,
+            target_3 REAL,
+            target_5 REAL,
+            target_10 REAL,
+            stop_loss REAL,
+            confidence REAL,
+            indicators TEXT
+        )
+    ''')
+
+
+def _add_indexes_and_signals(conn):
+    """Index the query paths and store the indicator breakdown as JSON plus a child table"""
+    conn.execute('''
+        CREATE INDEX IF NOT EXISTS idx_recommendations_symbol_timestamp
+        ON recommendations (symbol, timestamp)
+    ''')
+    conn.execute('''
+        CREATE INDEX IF NOT EXISTS idx_recommendations_timestamp
+        ON recommendations (timestamp)
+    ''')
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS recommendation_signals (
+            recommendation_id INTEGER NOT NULL
+                REFERENCES recommendations (id) ON DELETE CASCADE,
+            indicator TEXT NOT NULL,
+            value REAL,
+            label TEXT,
+            PRIMARY KEY (recommendation_id, indicator)
+        ) WITHOUT ROWID
+    ''')
+    conn.execute('''
+        CREATE INDEX IF NOT EXISTS idx_recommendation_signals_indicator_value
+        ON recommendation_signals (indicator, value, recommendation_id)
+    ''')
+    
+    # Rewrite legacy str(dict) breakdowns as JSON and fill the child table
+    rows = conn.execute('SELECT id, indicators FROM recommendations').fetchall()
+    for recommendation_id, indicators in rows:
+        parsed = parse_indicators(indicators)
+        conn.execute('UPDATE recommendations SET indicators = ? WHERE id = ?',
+                     (json.dumps(parsed, default=str), recommendation_id))
+        conn.executemany('INSERT OR REPLACE INTO recommendation_signals VALUES (?, ?, ?, ?)',
+                         _signal_rows(recommendation_id, parsed))
+
+
+# Dimensions kept in recommendation_stats and the column expression for each
+STATISTICS_DIMENSIONS = {
+    'signal': '{row}.signal',
+    'symbol': '{row}.symbol',
+    'day': 'date({row}.timestamp)',
+}
+
+
+def _add_statistics(conn):
+    """Summary table kept current by triggers, so statistics never scan recommendations"""
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS recommendation_stats (
+            dimension TEXT NOT NULL,
+            key TEXT NOT NULL,
+            count INTEGER NOT NULL DEFAULT 0,
+            confidence_sum REAL NOT NULL DEFAULT 0,
+            confidence_count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (dimension, key)
+        ) WITHOUT ROWID
+    ''')
+    _create_statistics_triggers(conn)
+    
+    # Backfill from the existing rows
+    conn.execute('DELETE FROM recommendation_stats')
+    for dimension, expression in STATISTICS_DIMENSIONS.items():
+        column = expression.format(row='recommendations')
+        conn.execute(f'''
+            INSERT INTO recommendation_stats (dimension, key, count, confidence_sum, confidence_count)
+            SELECT '{dimension}', {column}, COUNT(*), COALESCE(SUM(confidence), 0), COUNT(confidence)
+            FROM recommendations
+            GROUP BY {column}
+        ''')
+
+
+def _create_statistics_triggers(conn):
+    """Triggers that keep recommendation_stats in step with recommendations"""
+    def add(row, sign):
+        return ''.join(f'''
+            INSERT INTO recommendation_stats (dimension, key, count, confidence_sum, confidence_count)
+            VALUES ('{dimension}', {expression.format(row=row)}, {sign}1,
+                    {sign}COALESCE({row}.confidence, 0), {sign}({row}.confidence IS NOT NULL))
+            ON CONFLICT (dimension, key) DO UPDATE SET
+                count = count + excluded.count,
+                confidence_sum = confidence_sum + excluded.confidence_sum,
+                confidence_count = confidence_count + excluded.confidence_count;
+        ''' for dimension, expression in STATISTICS_DIMENSIONS.items())
+    
+    # Drop only the keys this row just decremented; the primary key serves
+    # each lookup, so a trim deleting many rows never scans the whole table
+    def prune(row):
+        return ''.join(f'''
+            DELETE FROM recommendation_stats
+            WHERE dimension = '{dimension}' AND key = {expression.format(row=row)} AND count <= 0;
+        ''' for dimension, expression in STATISTICS_DIMENSIONS.items())
+    
+    conn.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS recommendation_stats_insert
+        AFTER INSERT ON recommendations
+        BEGIN {add('NEW', '')} END
+    ''')
+    conn.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS recommendation_stats_delete
+        AFTER DELETE ON recommendations
+        BEGIN {add('OLD', '-')} {prune('OLD')} END
+    ''')
+    conn.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS recommendation_stats_update
+        AFTER UPDATE OF signal, symbol, timestamp, confidence ON recommendations
+        BEGIN {add('OLD', '-')} {add('NEW', '')} {prune('OLD')} END
+    ''')
+
+
+def _prune_statistics_by_key(conn):
+    """Recreate the statistics triggers so deletes prune by key, not by table scan"""
+    for trigger in ('insert', 'delete', 'update'):
+        conn.execute(f'DROP TRIGGER IF EXISTS recommendation_stats_{trigger}')
+    _create_statistics_triggers(conn)
+
+
+# Schema migrations; the database's PRAGMA user_version is the number applied
+MIGRATIONS = [
+    _create_recommendations,
+    _add_indexes_and_signals,
+    _add_statistics,
+    _prune_statistics_by_key,
+]
+
+
 class Database:
-    """Database handler for storing trading recommendations"""
+    """
+    Database handler for storing trading recommendations
+    
+    Connections are opened once and reused: a single writer connection
+    guarded by a lock (SQLite allows one writer at a time) and a small pool
+    of reader connections. The database runs in WAL mode so readers never
+    wait for the writer. Safe to share across threads/Streamlit sessions.
     
-    def __init__(self, db_path='trading_recommendations.db'):
+    Retention is amortized: inserts are plain appends, and old rows are
+    removed in one indexed range delete once the table passes a high-water
+    mark (max_rows + trim_batch) or the age check interval has elapsed.
+    """
+    
+    def __init__(self, db_path='trading_recommendations.db', pool_size=4,
+                 max_rows=100, max_age_days=None, trim_batch=20, age_check_interval=3600):
+        """
+        Args:
+            db_path: SQLite database file
+            pool_size: Maximum number of reader connections
+            max_rows: Keep (at least) the newest max_rows recommendations; None disables
+            max_age_days: Delete recommendations older than this; None disables
+            trim_batch: Rows allowed above max_rows before a trim runs
+            age_check_interval: Seconds between age-based trims
+        """
         self.db_path = db_path
+        self.pool_size = pool_size
+        self.max_rows = max_rows
+        self.max_age_days = max_age_days
+        self.trim_batch = trim_batch
+        self.age_check_interval = age_check_interval
+        self._last_age_trim = float('-inf')
+        self._write_lock = threading.Lock()
+        self._pool_lock = threading.Lock()
+        self._readers = queue.LifoQueue()
+        self._reader_count = 0
+        self._writer = self._connect()
         self.init_database()
     
+    def _connect(self):
+        """Open a connection configured for concurrent use"""
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=30,
+            check_same_thread=False,
+            cached_statements=256
+        )
+        if self.db_path != ':memory:':
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA busy_timeout=30000')
+        conn.execute('PRAGMA foreign_keys=ON')
+        return conn
+    
+    @contextmanager
+    def _write(self):
+        """Writer connection inside a transaction (committed on success)"""
+        with self._write_lock:
+            with self._writer:
+                yield self._writer
+    
+    @contextmanager
+    def _read(self):
+        """Borrow a reader connection from the pool"""
+        if self.db_path == ':memory:':
+            # Every connection to :memory: is a separate database
+            with self._write_lock:
+                yield self._writer
+            return
+        
+        try:
+            conn = self._readers.get_nowait()
+        except queue.Empty:
+            with self._pool_lock:
+                create = self._reader_count < self.pool_size
+                if create:
+                    self._reader_count += 1
+            conn = self._connect() if create else self._readers.get()
+        try:
+            yield conn
+        finally:
+            self._readers.put(conn)
+    
+    def close(self):
+        """Close every pooled connection"""
+        with self._write_lock:
+            self._writer.close()
+        while True:
+            try:
+                self._readers.get_nowait().close()
+            except queue.Empty:
+                break
+    
     def init_database(self):
-        """Initialize database and create tables if they don't exist"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS recommendations (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
-                symbol TEXT NOT NULL,
-                signal TEXT NOT NULL,
-                entry_price REAL NOT NULL,
-                target_3 REAL,
-                target_5 REAL,
-                target_10 REAL,
-                stop_loss REAL,
-                confidence REAL,
-                indicators TEXT
-            )
-        ''')
+        """Initialize database and apply any pending schema migrations"""
+        with self._write() as conn:
+            version = conn.execute('PRAGMA user_version').fetchone()[0]
+            for number, migrate in enumerate(MIGRATIONS, start=1):
+                if number > version:
+                    migrate(conn)
+                    conn.execute(f'PRAGMA user_version = {number}')
+            self._row_count = self._count_rows(conn)
+    
+    @staticmethod
+    def _count_rows(conn):
+        """
+        Rows in recommendations, from the trigger-maintained statistics
         
-        conn.commit()
-        conn.close()
+        Other processes (e.g. signal_service.py) may write to the same file,
+        so the count is re-read inside each write transaction rather than
+        tracked per instance; summing the per-signal counts reads a few rows.
+        """
+        return conn.execute('''
+            SELECT COALESCE(SUM(count), 0) FROM recommendation_stats WHERE dimension = 'signal'
+        ''').fetchone()[0]
     
-    def add_recommendation(self, symbol, signal, entry_price, target_3, target_5, 
+    def add_recommendation(self, symbol, signal, entry_price, target_3, target_5,
                           target_10, stop_loss, confidence, indicators):
-        """Add a new recommendation to the database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT INTO recommendations 
-            (symbol, signal, entry_price, target_3, target_5, target_10, 
-             stop_loss, confidence, indicators)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (symbol, signal, entry_price, target_3, target_5, target_10, 
-              stop_loss, confidence, indicators))
-        
-        conn.commit()
-        
-        # Keep only last 100 recommendations
-        cursor.execute('''
-            DELETE FROM recommendations 
-            WHERE id NOT IN (
-                SELECT id FROM recommendations 
-                ORDER BY timestamp DESC 
-                LIMIT 100
-            )
-        ''')
+        """
+        Add a new recommendation to the database
         
-        conn.commit()
-        conn.close()
+        `indicators` is the per-indicator signal dict from generate_signal
+        (a legacy str(dict) is still accepted); it is stored as JSON and in
+        recommendation_signals so it can be queried with find_recommendations().
+        """
+        self.add_recommendations([{
+            'symbol': symbol,
+            'signal': signal,
+            'entry_price': entry_price,
+            'target_3': target_3,
+            'target_5': target_5,
+            'target_10': target_10,
+            'stop_loss': stop_loss,
+            'confidence': confidence,
+            'indicators': indicators,
+        }])
+    
+    def add_recommendations(self, recommendations):
+        """Add several recommendations (dicts of add_recommendation arguments) in one transaction"""
+        with self._write() as conn:
+            for rec in recommendations:
+                indicators = parse_indicators(rec.get('indicators'))
+                cursor = conn.execute('''
+                    INSERT INTO recommendations
+                    (symbol, signal, entry_price, target_3, target_5, target_10,
+                     stop_loss, confidence, indicators)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ''', (rec['symbol'], rec['signal'], rec['entry_price'], rec.get('target_3'),
+                      rec.get('target_5'), rec.get('target_10'), rec.get('stop_loss'),
+                      rec.get('confidence'), json.dumps(indicators, default=str)))
+                conn.executemany('INSERT INTO recommendation_signals VALUES (?, ?, ?, ?)',
+                                 _signal_rows(cursor.lastrowid, indicators))
+            
+            self._row_count = self._count_rows(conn)
+            if self._retention_due():
+                self._apply_retention(conn)
     
-    def get_recent_recommendations(self, limit=10):
+    def _retention_due(self):
+        """Whether the high-water mark or the age check interval has been reached"""
+        if self.max_rows is not None and self._row_count > self.max_rows + self.trim_batch:
+            return True
+        return (self.max_age_days is not None
+                and time.monotonic() - self._last_age_trim >= self.age_check_interval)
+    
+    def _apply_retention(self, conn):
+        """Trim by count and by age on the writer connection; returns rows deleted"""
+        deleted = 0
+        
+        if self.max_rows is not None:
+            # ids increase with insertion time, so everything at or below the
+            # id of the (max_rows + 1)-th newest row is a primary key range
+            deleted += conn.execute('''
+                DELETE FROM recommendations
+                WHERE id <= (
+                    SELECT id FROM recommendations
+                    ORDER BY id DESC
+                    LIMIT 1 OFFSET ?
+                )
+            ''', (self.max_rows,)).rowcount
+        
+        if self.max_age_days is not None:
+            deleted += conn.execute('''
+                DELETE FROM recommendations
+                WHERE timestamp < datetime('now', '-' || ? || ' days')
+            ''', (self.max_age_days,)).rowcount
+            self._last_age_trim = time.monotonic()
+        
+        self._row_count -= deleted
+        return deleted
+    
+    def apply_retention(self):
+        """Run count and age retention now; returns the number of rows deleted"""
+        with self._write() as conn:
+            return self._apply_retention(conn)
+    
+    def get_recent_recommendations(self, limit=10, columns=None):
         """Get recent recommendations from database"""
-        conn = sqlite3.connect(self.db_path)
+        return self.get_recommendations_page(columns=columns, limit=limit)[0]
+    
+    def get_recommendations_page(self, columns=None, after=None, limit=100, symbol=None,
+                                 signal=None, ascending=False):
+        """
+        One page of recommendations, keyset-paginated on (timestamp, id)
+        
+        Each page seeks straight to its first row through the timestamp
+        index, so late pages cost the same as the first (unlike OFFSET).
+        
+        Example:
+            page, cursor = db.get_recommendations_page(limit=50)
+            while cursor is not None:
+                page, cursor = db.get_recommendations_page(after=cursor, limit=50)
+        
+        Args:
+            columns: Columns to select (default: all); id and timestamp are always included
+            after: Cursor returned with the previous page (None for the first page)
+            limit: Maximum rows per page
+            symbol: Only this instrument
+            signal: Only BUY/SELL/HOLD
+            ascending: Oldest first instead of newest first
         
+        Returns:
+            (DataFrame, cursor) where cursor is the (timestamp, id) of the last
+            row, or None when this was the last page
+        """
+        conditions = []
+        params = []
+        
+        if symbol is not None:
+            conditions.append('symbol = ?')
+            params.append(symbol)
+        if signal is not None:
+            conditions.append('signal = ?')
+            params.append(signal)
+        if after is not None:
+            conditions.append(f"(timestamp, id) {'>' if ascending else '<'} (?, ?)")
+            params.extend(after)
+        
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ''
+        order = 'ASC' if ascending else 'DESC'
         query = f'''
-            SELECT * FROM recommendations 
-            ORDER BY timestamp DESC 
-            LIMIT {limit}
+            SELECT {_projection(columns)} FROM recommendations
+            {where}
+            ORDER BY timestamp {order}, id {order}
+            LIMIT ?
         '''
         
-        df = pd.read_sql_query(query, conn)
-        conn.close()
+        with self._read() as conn:
+            page = pd.read_sql_query(query, conn, params=(*params, limit))
+        
+        if len(page) < limit:
+            return page, None
+        last = page.iloc[-1]
+        return page, (last['timestamp'], int(last['id']))
+    
+    def iter_recommendations(self, columns=None, chunk_size=1000, symbol=None, signal=None,
+                             ascending=False):
+        """
+        Yield every matching recommendation as DataFrames of up to chunk_size rows
         
-        return df
+        Pages are fetched one at a time, so exports and history views of a
+        large archive run in bounded memory. Arguments are as for
+        get_recommendations_page().
+        """
+        cursor = None
+        while True:
+            page, cursor = self.get_recommendations_page(
+                columns=columns, after=cursor, limit=chunk_size,
+                symbol=symbol, signal=signal, ascending=ascending,
+            )
+            if not page.empty:
+                yield page
+            if cursor is None:
+                return
     
     def get_recommendations_by_symbol(self, symbol, limit=20):
         """Get recommendations for a specific symbol"""
-        conn = sqlite3.connect(self.db_path)
-        
         query = '''
-            SELECT * FROM recommendations 
+            SELECT * FROM recommendations
             WHERE symbol = ?
-            ORDER BY timestamp DESC 
+            ORDER BY timestamp DESC
             LIMIT ?
         '''
         
-        df = pd.read_sql_query(query, conn, params=(symbol, limit))
-        conn.close()
+        with self._read() as conn:
+            return pd.read_sql_query(query, conn, params=(symbol, limit))
+    
+    def find_recommendations(self, signal=None, symbol=None, indicator=None, value=None, limit=100):
+        """
+        Filter recommendations inside SQLite, newest first
+        
+        Example: all BUYs where RSI was +2
+            db.find_recommendations(signal='BUY', indicator='RSI', value=2)
+        
+        Args:
+            signal: BUY/SELL/HOLD
+            symbol: Instrument symbol
+            indicator: Indicator name from the signal breakdown (e.g. 'RSI')
+            value: Indicator signal value (number, or label such as 'Strong')
+            limit: Maximum rows returned
+        """
+        joins = ''
+        conditions = []
+        params = []
         
-        return df
+        if indicator is not None:
+            joins = 'JOIN recommendation_signals s ON s.recommendation_id = r.id'
+            conditions.append('s.indicator = ?')
+            params.append(indicator)
+            if isinstance(value, str):
+                conditions.append('s.label = ?')
+                params.append(value)
+            elif value is not None:
+                conditions.append('s.value = ?')
+                params.append(float(value))
+        if signal is not None:
+            conditions.append('r.signal = ?')
+            params.append(signal)
+        if symbol is not None:
+            conditions.append('r.symbol = ?')
+            params.append(symbol)
+        
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ''
+        query = f'''
+            SELECT r.* FROM recommendations r
+            {joins}
+            {where}
+            ORDER BY r.timestamp DESC
+            LIMIT ?
+        '''
+        
+        with self._read() as conn:
+            return pd.read_sql_query(query, conn, params=(*params, limit))
     
-    def get_all_recommendations(self):
-        """Get all recommendations"""
-        conn = sqlite3.connect(self.db_path)
-        df = pd.read_sql_query('SELECT * FROM recommendations ORDER BY timestamp DESC', conn)
-        conn.close()
-        return df
+    def get_all_recommendations(self, columns=None):
+        """Get all recommendations (use iter_recommendations() for large archives)"""
+        with self._read() as conn:
+            return pd.read_sql_query(
+                f'SELECT {_projection(columns)} FROM recommendations ORDER BY timestamp DESC, id DESC',
+                conn,
+            )
     
     def clear_old_recommendations(self, days=30):
         """Clear recommendations older than specified days"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self._write() as conn:
+            deleted = conn.execute('''
+                DELETE FROM recommendations
+                WHERE timestamp < datetime('now', '-' || ? || ' days')
+            ''', (days,)).rowcount
+            self._row_count -= deleted
+    
+    def get_statistics(self):
+        """
+        Get statistics about recommendations
         
-        cursor.execute('''
-            DELETE FROM recommendations 
-            WHERE timestamp < datetime('now', '-' || ? || ' days')
-        ''', (days,))
+        Read from the trigger-maintained recommendation_stats table (one row
+        per signal), so the cost does not grow with the number of rows.
+        """
+        with self._read() as conn:
+            rows = conn.execute('''
+                SELECT key, count, confidence_sum, confidence_count
+                FROM recommendation_stats
+                WHERE dimension = 'signal'
+            ''').fetchall()
         
-        conn.commit()
-        conn.close()
+        confidence_sum = sum(row[2] for row in rows)
+        confidence_count = sum(row[3] for row in rows)
+        
+        return {
+            # Total recommendations
+            'total': sum(row[1] for row in rows),
+            # Buy/Sell/Hold counts
+            'signals': {signal: count for signal, count, _, _ in rows},
+            # Average confidence
+            'avg_confidence': confidence_sum / confidence_count if confidence_count else None,
+        }
     
-    def get_statistics(self):
-        """Get statistics about recommendations"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+    def get_statistics_breakdown(self, dimension='symbol'):
+        """
+        Recommendation count and average confidence per symbol, signal or day
         
-        stats = {}
+        Args:
+            dimension: 'symbol', 'signal' or 'day'
+        """
+        if dimension not in STATISTICS_DIMENSIONS:
+            raise ValueError(f"Unknown statistics dimension: {dimension}")
         
-        # Total recommendations
-        cursor.execute('SELECT COUNT(*) FROM recommendations')
-        stats['total'] = cursor.fetchone()[0]
+        query = '''
+            SELECT key AS {dimension}, count,
+                   confidence_sum / NULLIF(confidence_count, 0) AS avg_confidence
+            FROM recommendation_stats
+            WHERE dimension = ?
+            ORDER BY key
+        '''.format(dimension=dimension)
         
-        # Buy/Sell/Hold counts
-        cursor.execute('SELECT signal, COUNT(*) FROM recommendations GROUP BY signal')
-        signal_counts = cursor.fetchall()
-        stats['signals'] = {signal: count for signal, count in signal_counts}
+        with self._read() as conn:
+            return pd.read_sql_query(query, conn, params=(dimension,))
+
+
+class RecommendationWriter:
+    """
+    Background writer for recommendations
+    
+    submit() only puts the recommendation on a queue, so the caller (the
+    Streamlit script thread) never waits for SQLite or fsync. A daemon thread
+    drains the queue and commits everything waiting in one transaction via
+    Database.add_recommendations(). A recommendation identical to the last
+    one accepted for its symbol (same signal and entry price) is dropped, since
+    every rerun regenerates it. Pending writes are flushed at interpreter exit.
+    """
+    
+    def __init__(self, db, batch_size=100, flush_interval=0.5):
+        self.db = db
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue = queue.Queue()
+        self._last_submitted = {}
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='recommendation-writer', daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+    
+    def submit(self, symbol, signal, entry_price, target_3=None, target_5=None,
+               target_10=None, stop_loss=None, confidence=None, indicators=None):
+        """
+        Queue a recommendation for writing
         
-        # Average confidence
-        cursor.execute('SELECT AVG(confidence) FROM recommendations')
-        stats['avg_confidence'] = cursor.fetchone()[0]
+        Returns:
+            False if it repeated the previous recommendation for the symbol
+            and was coalesced away, True if it was queued
+        """
+        key = (signal, entry_price)
+        with self._lock:
+            if self._last_submitted.get(symbol) == key:
+                return False
+            self._last_submitted[symbol] = key
         
-        conn.close()
-        return stats
+        self._queue.put({
+            'symbol': symbol,
+            'signal': signal,
+            'entry_price': entry_price,
+            'target_3': target_3,
+            'target_5': target_5,
+            'target_10': target_10,
+            'stop_loss': stop_loss,
+            'confidence': confidence,
+            'indicators': indicators,
+        })
+        return True
+    
+    def _run(self):
+        while not (self._stopped.is_set() and self._queue.empty()):
+            try:
+                batch = [self._queue.get(timeout=self.flush_interval)]
+            except queue.Empty:
+                continue
+            
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            try:
+                self.db.add_recommendations(batch)
+            except Exception as e:
+                print(f"❌ Error writing {len(batch)} recommendation(s): {e}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+    
+    def flush(self):
+        """Block until every queued recommendation has been written"""
+        self._queue.join()
+    
+    def close(self):
+        """Flush pending writes and stop the background thread"""
+        if self._stopped.is_set():
+            return
+        self._stopped.set()
+        self._thread.join()
@@ -0,0 +1,104 @@
+import numpy as np
+import pandas as pd
+
+# Points per trace sent to the browser by default (about one per pixel of a wide chart)
+DEFAULT_MAX_POINTS = 2000
+
+
+def bucket_bounds(length, buckets):
+    """Start offsets of `buckets` contiguous, near-equal slices of range(length)"""
+    return np.linspace(0, length, buckets + 1).astype(np.int64)[:-1]
+
+
+def ohlc_buckets(df, max_points=DEFAULT_MAX_POINTS):
+    """
+    Aggregate OHLCV bars into at most max_points candles
+
+    Each bucket of consecutive bars becomes one candle: first Open, highest
+    High, lowest Low, last Close and summed Volume, stamped with the bucket's
+    first timestamp. Unlike picking every n-th bar this keeps every extreme,
+    so wicks and gaps are still visible after downsampling.
+
+    Returns:
+        DataFrame with the same columns (the input itself when it is small enough)
+    """
+    if max_points is None or len(df) <= max_points:
+        return df
+
+    starts = bucket_bounds(len(df), max_points)
+    ends = np.append(starts[1:], len(df)) - 1
+
+    buckets = {
+        'Open': df['Open'].to_numpy(dtype=np.float64)[starts],
+        'High': np.fmax.reduceat(df['High'].to_numpy(dtype=np.float64), starts),
+        'Low': np.fmin.reduceat(df['Low'].to_numpy(dtype=np.float64), starts),
+        'Close': df['Close'].to_numpy(dtype=np.float64)[ends],
+    }
+    if 'Volume' in df:
+        volume = np.nan_to_num(df['Volume'].to_numpy(dtype=np.float64))
+        buckets['Volume'] = np.add.reduceat(volume, starts)
+    return pd.DataFrame(buckets, index=df.index[starts])
+
+
+def lttb(values, max_points=DEFAULT_MAX_POINTS):
+    """
+    Largest-Triangle-Three-Buckets selection for a line series
+
+    Points are taken at bar positions (evenly spaced x). The first and last
+    points are always kept; from every bucket in between the point forming
+    the largest triangle with the previously kept point and the average of
+    the next bucket is kept, which preserves the visual shape (peaks,
+    troughs, trend changes) far better than striding. NaN points are skipped.
+
+    Returns:
+        Sorted integer positions of the points to keep
+    """
+    y = np.asarray(values, dtype=np.float64)
+    positions = np.flatnonzero(~np.isnan(y))
+    if max_points is None or len(positions) <= max(max_points, 2):
+        return positions
+    if max_points < 3:
+        return positions[[0, -1]]
+
+    x = positions.astype(np.float64)
+    y = y[positions]
+    n = len(positions)
+
+    # Interior buckets between the fixed first and last points
+    edges = np.linspace(1, n - 1, max_points - 1).astype(np.int64)
+    sums_x = np.add.reduceat(x[1:n - 1], edges[:-1] - 1)
+    sums_y = np.add.reduceat(y[1:n - 1], edges[:-1] - 1)
+    counts = np.diff(edges)
+    # Average of each bucket's successor; the last bucket looks at the last point
+    next_x = np.append(sums_x[1:] / counts[1:], x[-1])
+    next_y = np.append(sums_y[1:] / counts[1:], y[-1])
+
+    selected = np.empty(max_points, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+    previous = 0
+    for i in range(max_points - 2):
+        start, end = edges[i], edges[i + 1]
+        bucket_x = x[start:end]
+        bucket_y = y[start:end]
+        # Twice the triangle area; the constant factor does not change the argmax
+        area = np.abs(
+            (x[previous] - next_x[i]) * (bucket_y - y[previous])
+            - (x[previous] - bucket_x) * (next_y[i] - y[previous])
+        )
+        previous = start + int(np.argmax(area))
+        selected[i + 1] = previous
+
+    return positions[selected]
+
+
+def downsample_series(series, max_points=DEFAULT_MAX_POINTS):
+    """LTTB-downsampled copy of a Series (index preserved for the kept points)"""
+    return series.iloc[lttb(series.to_numpy(), max_points)]
+
+
+def visible_window(df, bars=None):
+    """The last `bars` rows of df (all rows when bars is None)"""
+    if bars is None or bars >= len(df):
+        return df
+    return df.iloc[-bars:]
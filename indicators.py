@@ -1,5 +1,272 @@
+from collections.abc import Mapping
+
 import pandas as pd
 import numpy as np
+from rolling import rolling_max, rolling_min, rolling_mean_abs_deviation
+
+
+def _rolling(kernel, values, period):
+    """Apply a NumPy rolling kernel to a Series and keep its index"""
+    return pd.Series(kernel(values.to_numpy(dtype=float), period), index=values.index)
+
+
+def _typical_price(high, low, close):
+    return (high + low + close) / 3
+
+
+def _true_range(high, low, prev_close):
+    high_low = high - low
+    high_close = np.abs(high - prev_close)
+    low_close = np.abs(low - prev_close)
+
+    ranges = pd.concat([high_low, high_close, low_close], axis=1)
+    return np.max(ranges, axis=1)
+
+
+def _rsi(delta, period):
+    gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
+    loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
+
+    rs = gain / loss
+    return 100 - (100 / (1 + rs))
+
+
+def _bollinger(sma, std, std_dev):
+    return sma + (std * std_dev), sma - (std * std_dev)
+
+
+def _stochastic_k(close, low_min, high_max):
+    return 100 * (close - low_min) / (high_max - low_min)
+
+
+def _directional_movement(high, low):
+    high_diff = high.diff()
+    low_diff = -low.diff()
+
+    pos_dm = high_diff.where((high_diff > low_diff) & (high_diff > 0), 0)
+    neg_dm = low_diff.where((low_diff > high_diff) & (low_diff > 0), 0)
+    return pos_dm, neg_dm
+
+
+def _directional_index(dm, atr, period):
+    return 100 * (dm.rolling(window=period).mean() / atr)
+
+
+def _adx(pos_di, neg_di, period):
+    dx = 100 * np.abs(pos_di - neg_di) / (pos_di + neg_di)
+    return dx.rolling(window=period).mean()
+
+
+def _cci(tp, period):
+    sma_tp = tp.rolling(window=period).mean()
+    mad = _rolling(rolling_mean_abs_deviation, tp, period)
+    return (tp - sma_tp) / (0.015 * mad)
+
+
+def _williams_r(close, high_max, low_min):
+    return -100 * (high_max - close) / (high_max - low_min)
+
+
+def _obv(delta, volume):
+    return (np.sign(delta) * volume).fillna(0).cumsum()
+
+
+def _mfi(typical_price, volume, period):
+    money_flow = typical_price * volume
+
+    positive_flow = money_flow.where(typical_price > typical_price.shift(1), 0)
+    negative_flow = money_flow.where(typical_price < typical_price.shift(1), 0)
+
+    positive_mf = positive_flow.rolling(window=period).sum()
+    negative_mf = negative_flow.rolling(window=period).sum()
+
+    mfr = positive_mf / negative_mf
+    return 100 - (100 / (1 + mfr))
+
+
+def _vwap(typical_price, volume):
+    return (typical_price * volume).cumsum() / volume.cumsum()
+
+
+class IndicatorGraph:
+    """
+    Dependency graph of indicator computations
+
+    Every node declares the inputs it reads (OHLCV columns or other nodes).
+    Evaluating a set of outputs computes each node at most once per frame,
+    so shared intermediates such as the typical price, the true range or
+    EMA_12/EMA_26 are reused instead of being rebuilt by every indicator.
+    """
+
+    def __init__(self):
+        self.nodes = {}
+
+    def node(self, name, *inputs):
+        """Decorator registering `func(*inputs)` as the producer of `name`"""
+        def register(func):
+            self.nodes[name] = (inputs, func)
+            return func
+        return register
+
+    def evaluate(self, df, names, cache=None):
+        """Compute `names` on `df`, reusing (and filling) `cache` for intermediates"""
+        cache = {} if cache is None else cache
+
+        def resolve(name):
+            if name not in cache:
+                if name in self.nodes:
+                    inputs, func = self.nodes[name]
+                    cache[name] = func(*[resolve(dependency) for dependency in inputs])
+                else:
+                    cache[name] = df[name]
+            return cache[name]
+
+        return {name: resolve(name) for name in names}
+
+
+INDICATOR_GRAPH = IndicatorGraph()
+node = INDICATOR_GRAPH.node
+
+# Shared intermediates
+node('close_diff', 'Close')(lambda close: close.diff())
+node('prev_close', 'Close')(lambda close: close.shift())
+node('typical_price', 'High', 'Low', 'Close')(_typical_price)
+node('true_range', 'High', 'Low', 'prev_close')(_true_range)
+node('close_std_20', 'Close')(lambda close: close.rolling(window=20).std())
+node('low_min_14', 'Low')(lambda low: _rolling(rolling_min, low, 14))
+node('high_max_14', 'High')(lambda high: _rolling(rolling_max, high, 14))
+node('directional_movement', 'High', 'Low')(_directional_movement)
+
+# Moving Averages
+for _period in (20, 50, 200):
+    node(f'SMA_{_period}', 'Close')(lambda close, period=_period: close.rolling(window=period).mean())
+for _period in (12, 26):
+    node(f'EMA_{_period}', 'Close')(lambda close, period=_period: close.ewm(span=period, adjust=False).mean())
+
+# RSI
+node('RSI', 'close_diff')(lambda delta: _rsi(delta, 14))
+
+# MACD
+node('MACD', 'EMA_12', 'EMA_26')(lambda ema_fast, ema_slow: ema_fast - ema_slow)
+node('MACD_signal', 'MACD')(lambda macd: macd.ewm(span=9, adjust=False).mean())
+node('MACD_hist', 'MACD', 'MACD_signal')(lambda macd, signal: macd - signal)
+
+# Bollinger Bands (the middle band is SMA_20)
+node('bollinger_bands', 'SMA_20', 'close_std_20')(lambda sma, std: _bollinger(sma, std, 2))
+node('BB_upper', 'bollinger_bands')(lambda bands: bands[0])
+node('BB_middle', 'SMA_20')(lambda sma: sma)
+node('BB_lower', 'bollinger_bands')(lambda bands: bands[1])
+
+# Stochastic
+node('Stoch_K', 'Close', 'low_min_14', 'high_max_14')(_stochastic_k)
+node('Stoch_D', 'Stoch_K')(lambda k: k.rolling(window=3).mean())
+
+# ATR
+node('ATR', 'true_range')(lambda true_range: true_range.rolling(14).mean())
+
+# OBV
+node('OBV', 'close_diff', 'Volume')(_obv)
+
+# ADX (reuses ATR)
+node('Plus_DI', 'directional_movement', 'ATR')(lambda dm, atr: _directional_index(dm[0], atr, 14))
+node('Minus_DI', 'directional_movement', 'ATR')(lambda dm, atr: _directional_index(dm[1], atr, 14))
+node('ADX', 'Plus_DI', 'Minus_DI')(lambda pos_di, neg_di: _adx(pos_di, neg_di, 14))
+
+# CCI
+node('CCI', 'typical_price')(lambda tp: _cci(tp, 20))
+
+# Williams %R
+node('Williams_R', 'Close', 'high_max_14', 'low_min_14')(_williams_r)
+
+# MFI
+node('MFI', 'typical_price', 'Volume')(lambda tp, volume: _mfi(tp, volume, 14))
+
+# VWAP
+node('VWAP', 'typical_price', 'Volume')(_vwap)
+
+del node
+
+# Outputs of calculate_all(), in order
+ALL_INDICATORS = [
+    'SMA_20', 'SMA_50', 'SMA_200', 'EMA_12', 'EMA_26',
+    'RSI',
+    'MACD', 'MACD_signal', 'MACD_hist',
+    'BB_upper', 'BB_middle', 'BB_lower',
+    'Stoch_K', 'Stoch_D',
+    'ATR',
+    'OBV',
+    'ADX', 'Plus_DI', 'Minus_DI',
+    'CCI',
+    'Williams_R',
+    'MFI',
+    'VWAP',
+]
+
+# Trailing bars each output needs for its last value to match a full-history
+# evaluation. None marks recursive/cumulative indicators (EMA, MACD, OBV, VWAP)
+# whose last value depends on the whole history.
+LAST_VALUE_WINDOWS = {
+    'SMA_20': 20, 'SMA_50': 50, 'SMA_200': 200, 'EMA_12': None, 'EMA_26': None,
+    'RSI': 15,
+    'MACD': None, 'MACD_signal': None, 'MACD_hist': None,
+    'BB_upper': 20, 'BB_middle': 20, 'BB_lower': 20,
+    'Stoch_K': 14, 'Stoch_D': 16,
+    'ATR': 15,
+    'OBV': None,
+    'ADX': 28, 'Plus_DI': 15, 'Minus_DI': 15,
+    'CCI': 20,
+    'Williams_R': 14,
+    'MFI': 15,
+    'VWAP': None,
+}
+
+
+class LazyIndicators(Mapping):
+    """
+    Read-only indicator mapping that computes each indicator on first access
+
+    Drop-in replacement for the dict returned by calculate_all(): values are
+    evaluated through INDICATOR_GRAPH when first looked up and memoized, and
+    intermediates are shared between lookups. With last_value=True each
+    indicator is evaluated on just the trailing LAST_VALUE_WINDOWS bars it
+    needs (at most 200 bars, for SMA_200) and only the recursive ones (EMA,
+    MACD, OBV, VWAP) see the full history. The returned Series are then short,
+    but their iloc[-1] matches the full-history value up to floating-point
+    rounding.
+    """
+
+    def __init__(self, df, names=ALL_INDICATORS, last_value=False):
+        self.df = df
+        self.last_value = last_value
+        self._names = list(names)
+        self._values = {}
+        self._caches = {}
+
+    def __getitem__(self, name):
+        if name not in self._values:
+            if name not in self._names:
+                raise KeyError(name)
+
+            # Windowed indicators share one tail frame sized for the longest
+            # window so their intermediates are still computed only once
+            windowed = self.last_value and LAST_VALUE_WINDOWS.get(name) is not None
+            frame = self.df.iloc[-self._tail_length():] if windowed else self.df
+            cache = self._caches.setdefault(windowed, {})
+            self._values[name] = INDICATOR_GRAPH.evaluate(frame, [name], cache)[name]
+        return self._values[name]
+
+    def _tail_length(self):
+        return max(window for window in LAST_VALUE_WINDOWS.values() if window is not None)
+
+    def __contains__(self, name):
+        return name in self._names
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def __len__(self):
+        return len(self._names)
+
 
 class TechnicalIndicators:
     """Calculate various technical indicators for trading analysis"""
@@ -17,13 +284,7 @@ class TechnicalIndicators:
     
     def calculate_rsi(self, period=14):
         """Relative Strength Index"""
-        delta = self.df['Close'].diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-        
-        rs = gain / loss
-        rsi = 100 - (100 / (1 + rs))
-        return rsi
+        return _rsi(self.df['Close'].diff(), period)
     
     def calculate_macd(self, fast=12, slow=26, signal=9):
         """Moving Average Convergence Divergence"""
@@ -41,148 +302,78 @@ class TechnicalIndicators:
         sma = self.df['Close'].rolling(window=period).mean()
         std = self.df['Close'].rolling(window=period).std()
         
-        upper_band = sma + (std * std_dev)
-        lower_band = sma - (std * std_dev)
+        upper_band, lower_band = _bollinger(sma, std, std_dev)
         
         return upper_band, sma, lower_band
     
     def calculate_stochastic(self, period=14):
         """Stochastic Oscillator"""
-        low_min = self.df['Low'].rolling(window=period).min()
-        high_max = self.df['High'].rolling(window=period).max()
+        low_min = _rolling(rolling_min, self.df['Low'], period)
+        high_max = _rolling(rolling_max, self.df['High'], period)
         
-        k = 100 * (self.df['Close'] - low_min) / (high_max - low_min)
+        k = _stochastic_k(self.df['Close'], low_min, high_max)
         d = k.rolling(window=3).mean()
         
         return k, d
     
     def calculate_atr(self, period=14):
         """Average True Range"""
-        high_low = self.df['High'] - self.df['Low']
-        high_close = np.abs(self.df['High'] - self.df['Close'].shift())
-        low_close = np.abs(self.df['Low'] - self.df['Close'].shift())
-        
-        ranges = pd.concat([high_low, high_close, low_close], axis=1)
-        true_range = np.max(ranges, axis=1)
+        true_range = _true_range(self.df['High'], self.df['Low'], self.df['Close'].shift())
         atr = true_range.rolling(period).mean()
         
         return atr
     
     def calculate_obv(self):
         """On-Balance Volume"""
-        obv = (np.sign(self.df['Close'].diff()) * self.df['Volume']).fillna(0).cumsum()
-        return obv
+        return _obv(self.df['Close'].diff(), self.df['Volume'])
     
     def calculate_adx(self, period=14):
         """Average Directional Index"""
-        high_diff = self.df['High'].diff()
-        low_diff = -self.df['Low'].diff()
-        
-        pos_dm = high_diff.where((high_diff > low_diff) & (high_diff > 0), 0)
-        neg_dm = low_diff.where((low_diff > high_diff) & (low_diff > 0), 0)
+        pos_dm, neg_dm = _directional_movement(self.df['High'], self.df['Low'])
         
         atr = self.calculate_atr(period)
         
-        pos_di = 100 * (pos_dm.rolling(window=period).mean() / atr)
-        neg_di = 100 * (neg_dm.rolling(window=period).mean() / atr)
-        
-        dx = 100 * np.abs(pos_di - neg_di) / (pos_di + neg_di)
-        adx = dx.rolling(window=period).mean()
+        pos_di = _directional_index(pos_dm, atr, period)
+        neg_di = _directional_index(neg_dm, atr, period)
+        adx = _adx(pos_di, neg_di, period)
         
         return adx, pos_di, neg_di
     
     def calculate_cci(self, period=20):
         """Commodity Channel Index"""
-        tp = (self.df['High'] + self.df['Low'] + self.df['Close']) / 3
-        sma_tp = tp.rolling(window=period).mean()
-        mad = tp.rolling(window=period).apply(lambda x: np.abs(x - x.mean()).mean())
-        
-        cci = (tp - sma_tp) / (0.015 * mad)
-        return cci
+        tp = _typical_price(self.df['High'], self.df['Low'], self.df['Close'])
+        return _cci(tp, period)
     
     def calculate_williams_r(self, period=14):
         """Williams %R"""
-        high_max = self.df['High'].rolling(window=period).max()
-        low_min = self.df['Low'].rolling(window=period).min()
+        high_max = _rolling(rolling_max, self.df['High'], period)
+        low_min = _rolling(rolling_min, self.df['Low'], period)
         
-        williams_r = -100 * (high_max - self.df['Close']) / (high_max - low_min)
-        return williams_r
+        return _williams_r(self.df['Close'], high_max, low_min)
     
     def calculate_mfi(self, period=14):
         """Money Flow Index"""
-        typical_price = (self.df['High'] + self.df['Low'] + self.df['Close']) / 3
-        money_flow = typical_price * self.df['Volume']
-        
-        positive_flow = money_flow.where(typical_price > typical_price.shift(1), 0)
-        negative_flow = money_flow.where(typical_price < typical_price.shift(1), 0)
-        
-        positive_mf = positive_flow.rolling(window=period).sum()
-        negative_mf = negative_flow.rolling(window=period).sum()
-        
-        mfr = positive_mf / negative_mf
-        mfi = 100 - (100 / (1 + mfr))
-        
-        return mfi
+        typical_price = _typical_price(self.df['High'], self.df['Low'], self.df['Close'])
+        return _mfi(typical_price, self.df['Volume'], period)
     
     def calculate_vwap(self):
         """Volume Weighted Average Price"""
-        typical_price = (self.df['High'] + self.df['Low'] + self.df['Close']) / 3
-        vwap = (typical_price * self.df['Volume']).cumsum() / self.df['Volume'].cumsum()
-        return vwap
+        typical_price = _typical_price(self.df['High'], self.df['Low'], self.df['Close'])
+        return _vwap(typical_price, self.df['Volume'])
     
-    def calculate_all(self):
-        """Calculate all technical indicators"""
-        indicators = {}
-        
-        # Moving Averages
-        indicators['SMA_20'] = self.calculate_sma(20)
-        indicators['SMA_50'] = self.calculate_sma(50)
-        indicators['SMA_200'] = self.calculate_sma(200)
-        indicators['EMA_12'] = self.calculate_ema(12)
-        indicators['EMA_26'] = self.calculate_ema(26)
-        
-        # RSI
-        indicators['RSI'] = self.calculate_rsi(14)
-        
-        # MACD
-        macd, signal, hist = self.calculate_macd()
-        indicators['MACD'] = macd
-        indicators['MACD_signal'] = signal
-        indicators['MACD_hist'] = hist
-        
-        # Bollinger Bands
-        bb_upper, bb_middle, bb_lower = self.calculate_bollinger_bands()
-        indicators['BB_upper'] = bb_upper
-        indicators['BB_middle'] = bb_middle
-        indicators['BB_lower'] = bb_lower
-        
-        # Stochastic
-        stoch_k, stoch_d = self.calculate_stochastic()
-        indicators['Stoch_K'] = stoch_k
-        indicators['Stoch_D'] = stoch_d
-        
-        # ATR
-        indicators['ATR'] = self.calculate_atr()
-        
-        # OBV
-        indicators['OBV'] = self.calculate_obv()
-        
-        # ADX
-        adx, pos_di, neg_di = self.calculate_adx()
-        indicators['ADX'] = adx
-        indicators['Plus_DI'] = pos_di
-        indicators['Minus_DI'] = neg_di
-        
-        # CCI
-        indicators['CCI'] = self.calculate_cci()
-        
-        # Williams %R
-        indicators['Williams_R'] = self.calculate_williams_r()
-        
-        # MFI
-        indicators['MFI'] = self.calculate_mfi()
-        
-        # VWAP
-        indicators['VWAP'] = self.calculate_vwap()
-        
-        return indicators
+    def calculate_all(self, lazy=False, last_value=False):
+        """
+        Calculate all technical indicators
+        
+        Evaluated through INDICATOR_GRAPH so intermediates shared between
+        indicators are computed once per call.
+        
+        Args:
+            lazy: Return a LazyIndicators mapping that computes each indicator
+                  on first access instead of building every Series up front
+            last_value: Lazy mapping that only evaluates the trailing window
+                        each indicator needs (enough for .iloc[-1]); implies lazy
+        """
+        if lazy or last_value:
+            return LazyIndicators(self.df, last_value=last_value)
+        return INDICATOR_GRAPH.evaluate(self.df, ALL_INDICATORS)
@@ -0,0 +1,84 @@
+import threading
+import time
+
+
+class MarketPoller:
+    """
+    One background thread that keeps the latest bars of every watched series
+
+    Sessions call get() instead of fetching themselves. The first request for
+    a (symbol, period, interval) fetches it immediately; from then on the
+    poller refreshes it every `interval` seconds for as long as some session
+    keeps asking for it, and get() just returns the newest copy. A series
+    nobody has asked for within `expire_after` seconds stops being polled.
+    However many sessions watch a symbol, the source sees one fetch per
+    refresh and no session thread waits on the network between updates.
+    """
+
+    def __init__(self, fetch, interval=60, expire_after=300):
+        """
+        Args:
+            fetch: Callable fetch(symbol, period, interval) returning an OHLCV DataFrame
+            interval: Seconds between refreshes of each watched series
+            expire_after: Seconds without a get() after which a series is dropped
+        """
+        self.fetch = fetch
+        self.interval = interval
+        self.expire_after = expire_after
+        self._series = {}
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name='market-poller', daemon=True)
+        self._thread.start()
+
+    def get(self, symbol, period="3mo", interval="1d"):
+        """Latest bars for the series, fetching synchronously only the first time"""
+        key = (symbol, period, interval)
+        with self._lock:
+            entry = self._series.get(key)
+            if entry is not None:
+                entry['requested_at'] = time.monotonic()
+                return entry['bars']
+
+        bars = self.fetch(symbol, period, interval)
+        now = time.monotonic()
+        with self._lock:
+            self._series[key] = {'bars': bars, 'fetched_at': now, 'requested_at': now}
+        return bars
+
+    def fetched_at(self, symbol, period="3mo", interval="1d"):
+        """Wall-clock time of the series' last refresh (None if it is not watched)"""
+        with self._lock:
+            entry = self._series.get((symbol, period, interval))
+            if entry is None:
+                return None
+            return time.time() - (time.monotonic() - entry['fetched_at'])
+
+    def _run(self):
+        while True:
+            now = time.monotonic()
+            with self._lock:
+                for key in [key for key, entry in self._series.items()
+                            if now - entry['requested_at'] > self.expire_after]:
+                    del self._series[key]
+                due = [key for key, entry in self._series.items()
+                       if now - entry['fetched_at'] >= self.interval]
+                next_due = min((entry['fetched_at'] + self.interval for entry in self._series.values()),
+                               default=now + self.interval)
+
+            for key in due:
+                try:
+                    bars = self.fetch(*key)
+                except Exception as e:
+                    print(f"❌ Error polling {key[0]} ({key[2]}): {e}")
+                    bars = None
+                with self._lock:
+                    entry = self._series.get(key)
+                    if entry is None:
+                        continue
+                    entry['fetched_at'] = time.monotonic()
+                    # Keep serving the previous bars if the refresh failed
+                    if bars is not None and not bars.empty:
+                        entry['bars'] = bars
+
+            if not due:
+                time.sleep(max(0.1, next_due - time.monotonic()))
@@ -0,0 +1,97 @@
+import cProfile
+import io
+import json
+import logging
+import pstats
+import time
+from contextlib import contextmanager, nullcontext
+
+logger = logging.getLogger('trading_dashboard.timings')
+# One JSON object per line on stderr, for log shippers and metrics pipelines;
+# attach other handlers to this logger to send the records elsewhere
+if not logger.handlers:
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(logging.Formatter('%(message)s'))
+    logger.addHandler(_handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+_DISABLED = nullcontext()
+
+
+class StageTimer:
+    """
+    Wall-clock timings of the named stages of one run
+
+    Wrap each stage in `with timer.stage('fetch'):`. A disabled timer hands
+    out one shared no-op context manager, so leaving the instrumentation in
+    place costs nothing when timings are turned off. A stage that runs more
+    than once (e.g. two charts) accumulates.
+    """
+
+    def __init__(self, enabled=True, run='rerun'):
+        self.enabled = enabled
+        self.run = run
+        self.stages = {}
+        self.started = time.perf_counter()
+
+    def stage(self, name):
+        if not self.enabled:
+            return _DISABLED
+        return self._measure(name)
+
+    @contextmanager
+    def _measure(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages[name] = self.stages.get(name, 0.0) + time.perf_counter() - start
+
+    def total(self):
+        """Seconds since the timer was created"""
+        return time.perf_counter() - self.started
+
+    def as_dict(self, **fields):
+        """Timings in milliseconds plus any extra fields, ready for JSON"""
+        return {
+            'run': self.run,
+            **fields,
+            'total_ms': round(self.total() * 1000, 3),
+            'stages_ms': {name: round(seconds * 1000, 3) for name, seconds in self.stages.items()},
+        }
+
+    def log(self, **fields):
+        """Emit the timings as one structured (JSON) log record"""
+        if self.enabled:
+            logger.info(json.dumps(self.as_dict(**fields), default=str))
+
+
+@contextmanager
+def profiled(enabled=True):
+    """
+    Run the block under cProfile
+
+    Yields a dict whose 'stats' entry is filled with a pstats.Stats once
+    the block finishes (left empty when disabled).
+    """
+    result = {}
+    if not enabled:
+        yield result
+        return
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield result
+    finally:
+        profiler.disable()
+        result['stats'] = pstats.Stats(profiler)
+
+
+def format_stats(stats, limit=25, sort='cumulative'):
+    """The top `limit` functions of a pstats.Stats as text"""
+    output = io.StringIO()
+    stats.stream = output
+    stats.sort_stats(sort).print_stats(limit)
+    return output.getvalue()
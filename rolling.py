@@ -0,0 +1,65 @@
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+def _empty_result(values, window):
+    x = np.asarray(values, dtype=float)
+    if window < 1:
+        raise ValueError("window must be >= 1")
+    return x, np.full(len(x), np.nan)
+
+
+def _rolling_extreme(values, window, ufunc, identity):
+    """
+    Rolling min/max in O(n) using the van Herk/Gil-Werman block scheme
+
+    This is the array form of the monotonic-deque algorithm: the series is
+    cut into blocks of `window` values, a forward and a backward running
+    extreme is computed inside each block, and every window is answered by
+    combining one backward value with one forward value. NaN inside a window
+    propagates to that window's result, the same as pandas .rolling().
+    """
+    x, out = _empty_result(values, window)
+    n = len(x)
+    if n < window:
+        return out
+
+    pad = (-n) % window
+    blocks = np.concatenate([x, np.full(pad, identity)]).reshape(-1, window)
+    prefix = ufunc.accumulate(blocks, axis=1).ravel()
+    suffix = ufunc.accumulate(blocks[:, ::-1], axis=1)[:, ::-1].ravel()
+
+    out[window - 1:] = ufunc(suffix[:n - window + 1], prefix[window - 1:n])
+    return out
+
+
+def rolling_max(values, window):
+    """Rolling maximum, equivalent to pd.Series(values).rolling(window).max()"""
+    return _rolling_extreme(values, window, np.maximum, -np.inf)
+
+
+def rolling_min(values, window):
+    """Rolling minimum, equivalent to pd.Series(values).rolling(window).min()"""
+    return _rolling_extreme(values, window, np.minimum, np.inf)
+
+
+def rolling_mean_abs_deviation(values, window, chunk_size=65536):
+    """
+    Rolling mean absolute deviation around each window's own mean
+
+    Equivalent to rolling(window).apply(lambda x: np.abs(x - x.mean()).mean())
+    but evaluated on strided window views, so there is no Python call per bar.
+    Windows are processed in chunks to keep the temporary arrays bounded.
+    """
+    x, out = _empty_result(values, window)
+    n = len(x)
+    if n < window:
+        return out
+
+    windows = sliding_window_view(x, window)
+    for start in range(0, len(windows), chunk_size):
+        block = windows[start:start + chunk_size]
+        mean = block.mean(axis=1, keepdims=True)
+        out[window - 1 + start:window - 1 + start + len(block)] = np.abs(block - mean).mean(axis=1)
+
+    return out
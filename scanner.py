@@ -0,0 +1,109 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+from indicators import TechnicalIndicators
+from strategy import TradingStrategy
+
+# Requests per second allowed against each data provider (None = unlimited)
+RATE_LIMITS = {
+    'yahoo': 4.0,
+}
+
+# Symbols scanned when none are given
+DEFAULT_WATCHLIST = ['GC=F', 'EURUSD=X', '^NDX', '^GSPC', 'BTC-USD']
+
+
+class RateLimiter:
+    """Thread-safe token bucket allowing `rate` calls per second with bursts up to `burst`"""
+
+    def __init__(self, rate, burst=None):
+        self.rate = rate
+        self.capacity = burst or max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a call is allowed"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+class WatchlistScanner:
+    """
+    Scan many symbols concurrently and rank their signals
+
+    Bars are fetched on a bounded thread pool so scan time follows the
+    data source's latency and rate limit rather than symbols x latency.
+    Each symbol then goes through TechnicalIndicators (last-value mode,
+    since only the latest signal is needed) and TradingStrategy.evaluate.
+    """
+
+    def __init__(self, provider, max_workers=16, period="3mo", interval="1h", rate_limit=None):
+        self.provider = provider
+        self.max_workers = max_workers
+        self.period = period
+        self.interval = interval
+
+        rate = rate_limit if rate_limit is not None else RATE_LIMITS.get(provider.name)
+        self.limiter = RateLimiter(rate) if rate else None
+
+    def scan_symbol(self, symbol):
+        """Fetch, analyse and summarize one symbol; errors are reported in the row"""
+        row = {'symbol': symbol, 'signal': None, 'confidence': None, 'score': None,
+               'price': None, 'change_pct': None, 'error': None}
+        try:
+            if self.limiter:
+                self.limiter.acquire()
+            df = self.provider.get_history(symbol, period=self.period, interval=self.interval)
+            if df is None or len(df) < 2:
+                row['error'] = 'No data'
+                return row
+
+            indicators = TechnicalIndicators(df).calculate_all(last_value=True)
+            recommendation = TradingStrategy(df, indicators).evaluate()
+
+            price = float(df['Close'].iloc[-1])
+            previous = float(df['Close'].iloc[-2])
+            row.update({
+                'signal': recommendation['signal'],
+                'confidence': recommendation['confidence'],
+                'score': recommendation['total_score'],
+                'price': price,
+                'change_pct': (price - previous) / previous * 100,
+            })
+        except Exception as e:
+            row['error'] = str(e)
+        return row
+
+    def scan(self, symbols):
+        """
+        Scan a watchlist
+
+        Returns:
+            DataFrame with one row per symbol (signal, confidence, score,
+            price, change_pct, error), strongest signals first
+        """
+        symbols = list(dict.fromkeys(s.strip() for s in symbols if s and s.strip()))
+        if not symbols:
+            return pd.DataFrame(columns=['symbol', 'signal', 'confidence', 'score',
+                                         'price', 'change_pct', 'error'])
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(symbols))) as executor:
+            rows = list(executor.map(self.scan_symbol, symbols))
+
+        results = pd.DataFrame(rows)
+        results['strength'] = results['score'].abs()
+        results = results.sort_values('strength', ascending=False, na_position='last')
+        return results.drop(columns='strength').reset_index(drop=True)
@@ -0,0 +1,112 @@
+"""
+Headless signal service
+
+Evaluates a list of symbols with TechnicalIndicators and TradingStrategy and
+stores BUY/SELL recommendations in the database, once or on a schedule.
+It never imports Streamlit or Plotly, so it starts quickly and can run
+from cron or in a worker container.
+
+Usage:
+    python signal_service.py                       # default watchlist, once
+    python signal_service.py --symbols GC=F BTC-USD --every 300
+    MARKET_DATA_PROVIDER=synthetic python signal_service.py
+"""
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from data_sources import get_market_data, get_provider
+from database import Database, RecommendationWriter
+from indicators import TechnicalIndicators
+from scanner import DEFAULT_WATCHLIST
+from strategy import TradingStrategy
+
+
+def evaluate_symbol(provider, symbol, period="3mo", interval="1h", margin=1000, leverage=1):
+    """Recommendation for the latest bar of a symbol (None when there is no data)"""
+    df = get_market_data(symbol, period=period, interval=interval, provider=provider)
+    if df is None or df.empty:
+        return None
+
+    indicators = TechnicalIndicators(df).calculate_all(last_value=True)
+    strategy = TradingStrategy(df, indicators)
+    position_size = (margin * leverage) / strategy.current_price if strategy.current_price else 0
+    return strategy.generate_signal(margin, leverage, position_size)
+
+
+def run_once(provider, writer, symbols, period="3mo", interval="1h", margin=1000, leverage=1,
+             max_workers=8):
+    """
+    Evaluate every symbol and queue BUY/SELL recommendations for writing
+
+    Returns:
+        Dict mapping symbol to its recommendation (or the error message)
+    """
+    def evaluate(symbol):
+        try:
+            return evaluate_symbol(provider, symbol, period, interval, margin, leverage)
+        except Exception as e:
+            return str(e)
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(symbols)))) as executor:
+        results = dict(zip(symbols, executor.map(evaluate, symbols)))
+
+    for symbol, recommendation in results.items():
+        if not isinstance(recommendation, dict):
+            print(f"❌ {symbol}: {recommendation or 'no data'}")
+            continue
+        print(f"{symbol}: {recommendation['signal']} "
+              f"(score {recommendation['total_score']:.2f}, confidence {recommendation['confidence']:.1f}%)")
+        if recommendation['signal'] in ("BUY", "SELL"):
+            writer.submit(
+                symbol=symbol,
+                signal=recommendation['signal'],
+                entry_price=recommendation['entry_price'],
+                target_3=recommendation['targets']['3%'],
+                target_5=recommendation['targets']['5%'],
+                target_10=recommendation['targets']['10%'],
+                stop_loss=recommendation['stop_loss'],
+                confidence=recommendation['confidence'],
+                indicators=recommendation['indicators']
+            )
+    writer.flush()
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--symbols', nargs='+', default=DEFAULT_WATCHLIST)
+    parser.add_argument('--period', default='3mo')
+    parser.add_argument('--interval', default='1h')
+    parser.add_argument('--margin', type=float, default=1000.0)
+    parser.add_argument('--leverage', type=float, default=1.0)
+    parser.add_argument('--every', type=float, default=0,
+                        help='Seconds between runs (default: run once and exit)')
+    parser.add_argument('--db', default='trading_recommendations.db')
+    parser.add_argument('--provider', default=None,
+                        help='yahoo, replay or synthetic (default: MARKET_DATA_PROVIDER or yahoo)')
+    parser.add_argument('--workers', type=int, default=8)
+    args = parser.parse_args(argv)
+
+    provider = get_provider(args.provider)
+    db = Database(args.db)
+    writer = RecommendationWriter(db)
+    try:
+        while True:
+            started = time.monotonic()
+            print(f"--- {datetime.now():%Y-%m-%d %H:%M:%S} evaluating {len(args.symbols)} symbol(s)")
+            run_once(provider, writer, args.symbols, args.period, args.interval,
+                     args.margin, args.leverage, args.workers)
+            if not args.every:
+                break
+            time.sleep(max(0.0, args.every - (time.monotonic() - started)))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        writer.close()
+        db.close()
+
+
+if __name__ == '__main__':
+    main()
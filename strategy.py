@@ -1,15 +1,214 @@
 import numpy as np
 import pandas as pd
 
+# Category weights used to combine the analyze_* scores, in summation order
+CATEGORY_WEIGHTS = {
+    'trend': 1.5,       # Trend is important
+    'momentum': 2.0,    # Momentum is very important
+    'volatility': 1.0,  # Volatility context
+    'volume': 1.2,      # Volume confirmation
+    'strength': 1.0,    # Trend strength
+}
+
+# Largest absolute score each category can produce
+CATEGORY_MAX_SCORES = {
+    'trend': 2.5,
+    'momentum': 9.5,
+    'volatility': 4,
+    'volume': 2,
+    'strength': 1.5,
+}
+
+# Total score above/below which a BUY/SELL signal is issued
+BUY_THRESHOLD = 5
+SELL_THRESHOLD = -5
+
+# Profit target and stop-loss price multipliers for long (BUY) and short (SELL) trades
+TARGET_MULTIPLIERS = {
+    'BUY': {'3%': 1.03, '5%': 1.05, '10%': 1.10},
+    'SELL': {'3%': 0.97, '5%': 0.95, '10%': 0.90},
+}
+STOP_LOSS_MULTIPLIERS = {'BUY': 0.98, 'SELL': 1.02}
+
+# Tunable strategy parameters: category weights, signal thresholds and the
+# oscillator cutoffs used by analyze_momentum
+DEFAULT_PARAMS = {
+    **{f'{name}_weight': weight for name, weight in CATEGORY_WEIGHTS.items()},
+    'buy_threshold': BUY_THRESHOLD,
+    'sell_threshold': SELL_THRESHOLD,
+    'rsi_oversold': 30,
+    'rsi_weak_oversold': 40,
+    'rsi_overbought': 70,
+    'rsi_weak_overbought': 60,
+    'stoch_oversold': 20,
+    'stoch_overbought': 80,
+    'cci_oversold': -100,
+    'cci_overbought': 100,
+    'williams_oversold': -80,
+    'williams_overbought': -20,
+    'mfi_oversold': 20,
+    'mfi_overbought': 80,
+}
+
+
+def strategy_params(params=None):
+    """Defaults overridden by `params`; unknown names raise ValueError"""
+    params = params or {}
+    unknown = set(params) - set(DEFAULT_PARAMS)
+    if unknown:
+        raise ValueError(f"Unknown strategy parameter(s): {', '.join(sorted(unknown))}")
+    return {**DEFAULT_PARAMS, **params}
+
+
+def category_weights(params):
+    """Category weights from a parameter dict, in summation order"""
+    return {name: params[f'{name}_weight'] for name in CATEGORY_WEIGHTS}
+
+
+def max_possible_score(weights=CATEGORY_WEIGHTS):
+    """Normalizer that turns the absolute total score into a confidence"""
+    return abs(sum(weights[name] * CATEGORY_MAX_SCORES[name] for name in CATEGORY_MAX_SCORES))
+
+
+def _values(data, name):
+    """Indicator as a float NumPy array (Series, array or list)"""
+    return np.asarray(data[name], dtype=float)
+
+
+def _score_trend(close, ind):
+    sma_20, sma_50 = _values(ind, 'SMA_20'), _values(ind, 'SMA_50')
+    ema_12, ema_26 = _values(ind, 'EMA_12'), _values(ind, 'EMA_26')
+
+    score = np.select([sma_20 > sma_50, sma_20 < sma_50], [1.0, -1.0], 0.0)
+    score += np.where(np.isnan(sma_20), 0.0, np.where(close > sma_20, 0.5, -0.5))
+    score += np.where(np.isnan(ema_12) | np.isnan(ema_26), 0.0, np.where(ema_12 > ema_26, 1.0, -1.0))
+    return score
+
+
+def _score_momentum(close, ind, p):
+    rsi = _values(ind, 'RSI')
+    score = np.select(
+        [rsi < p['rsi_oversold'], rsi < p['rsi_weak_oversold'],
+         rsi > p['rsi_overbought'], rsi > p['rsi_weak_overbought']],
+        [2.0, 1.0, -2.0, -1.0],
+        0.0,
+    )
+
+    macd, macd_signal, hist = _values(ind, 'MACD'), _values(ind, 'MACD_signal'), _values(ind, 'MACD_hist')
+    score += np.select([(macd > macd_signal) & (hist > 0), (macd < macd_signal) & (hist < 0)], [1.5, -1.5], 0.0)
+
+    stoch_k, stoch_d = _values(ind, 'Stoch_K'), _values(ind, 'Stoch_D')
+    score += np.select(
+        [(stoch_k < p['stoch_oversold']) & (stoch_k > stoch_d),
+         (stoch_k > p['stoch_overbought']) & (stoch_k < stoch_d)],
+        [1.5, -1.5],
+        0.0,
+    )
+
+    cci = _values(ind, 'CCI')
+    score += np.select([cci < p['cci_oversold'], cci > p['cci_overbought']], [1.0, -1.0], 0.0)
+
+    williams = _values(ind, 'Williams_R')
+    score += np.select([williams < p['williams_oversold'], williams > p['williams_overbought']], [1.0, -1.0], 0.0)
+
+    mfi = _values(ind, 'MFI')
+    score += np.select([mfi < p['mfi_oversold'], mfi > p['mfi_overbought']], [1.0, -1.0], 0.0)
+    return score
+
+
+def _score_volatility(close, ind):
+    bb_upper, bb_lower, bb_middle = _values(ind, 'BB_upper'), _values(ind, 'BB_lower'), _values(ind, 'BB_middle')
+    valid = ~(np.isnan(bb_upper) | np.isnan(bb_lower) | np.isnan(bb_middle))
+
+    score = np.select(
+        [close < bb_lower, close < bb_middle, close > bb_upper, close > bb_middle],
+        [2.0, 1.0, -2.0, -1.0],
+        0.0,
+    )
+    return np.where(valid, score, 0.0)
+
+
+def _score_volume(close, volume, ind):
+    obv = pd.Series(_values(ind, 'OBV'))
+    obv_sma = obv.rolling(window=20).mean().to_numpy()
+    obv = obv.to_numpy()
+    score = np.where(np.isnan(obv) | np.isnan(obv_sma), 0.0, np.where(obv > obv_sma, 1.0, -1.0))
+
+    avg_volume = pd.Series(volume).rolling(window=20).mean().to_numpy()
+    price_change = np.diff(close, prepend=np.nan)
+    spike = ~np.isnan(avg_volume) & ~np.isnan(volume) & (volume > avg_volume * 1.5)
+    score += np.where(spike, np.where(price_change > 0, 0.5, -0.5), 0.0)
+
+    vwap = _values(ind, 'VWAP')
+    score += np.where(np.isnan(vwap), 0.0, np.where(close > vwap, 0.5, -0.5))
+    return score
+
+
+def _score_strength(close, ind):
+    adx, plus_di, minus_di = _values(ind, 'ADX'), _values(ind, 'Plus_DI'), _values(ind, 'Minus_DI')
+    valid = ~(np.isnan(adx) | np.isnan(plus_di) | np.isnan(minus_di))
+    direction = np.where(plus_di > minus_di, 1.0, -1.0)
+
+    score = np.select([adx > 25, adx > 20], [direction, direction * 0.5], 0.0)
+    return np.where(valid, score, 0.0)
+
+
+def score_history(close, volume, indicators, params=None):
+    """
+    Vectorized generate_signal over every bar of a history
+
+    Applies the same rules, category weights and thresholds as the
+    TradingStrategy.analyze_* methods and generate_signal, but to whole
+    arrays at once instead of only the last bar.
+
+    Args:
+        close: Close prices (array-like)
+        volume: Volumes (array-like)
+        indicators: Mapping of indicator name to full-length values, as
+                    returned by TechnicalIndicators.calculate_all()
+        params: Optional overrides of DEFAULT_PARAMS
+
+    Returns:
+        Dictionary of NumPy arrays, one value per bar: 'score', 'signal'
+        ("BUY"/"SELL"/"HOLD"), 'confidence' and the unweighted per-category
+        scores ('trend', 'momentum', 'volatility', 'volume', 'strength')
+    """
+    close = np.asarray(close, dtype=float)
+    volume = np.asarray(volume, dtype=float)
+    params = strategy_params(params)
+    weights = category_weights(params)
+
+    categories = {
+        'trend': _score_trend(close, indicators),
+        'momentum': _score_momentum(close, indicators, params),
+        'volatility': _score_volatility(close, indicators),
+        'volume': _score_volume(close, volume, indicators),
+        'strength': _score_strength(close, indicators),
+    }
+
+    total_score = np.zeros(len(close))
+    for name, weight in weights.items():
+        total_score = total_score + categories[name] * weight
+
+    confidence = np.minimum(100, (np.abs(total_score) / max_possible_score(weights)) * 100)
+    signal = np.select(
+        [total_score > params['buy_threshold'], total_score < params['sell_threshold']],
+        ['BUY', 'SELL'],
+        'HOLD',
+    )
+
+    return {'score': total_score, 'signal': signal, 'confidence': confidence, **categories}
+
 class TradingStrategy:
     """
     Combined trading strategy using multiple technical indicators
     Generates buy/sell signals with confidence scores
     """
     
-    def __init__(self, df, indicators):
+    def __init__(self, df, indicators, params=None):
         self.df = df
         self.indicators = indicators
+        self.params = strategy_params(params)
         try:
             self.current_price = float(df['Close'].iloc[-1])
         except (TypeError, ValueError, KeyError, IndexError) as e:
@@ -114,16 +313,16 @@ class TradingStrategy:
         # RSI
         rsi = self.safe_get_value('RSI')
         if rsi is not None:
-            if rsi < 30:
+            if rsi < self.params['rsi_oversold']:
                 score += 2  # Oversold - strong buy
                 signals['RSI'] = 2
-            elif rsi < 40:
+            elif rsi < self.params['rsi_weak_oversold']:
                 score += 1  # Approaching oversold
                 signals['RSI'] = 1
-            elif rsi > 70:
+            elif rsi > self.params['rsi_overbought']:
                 score -= 2  # Overbought - strong sell
                 signals['RSI'] = -2
-            elif rsi > 60:
+            elif rsi > self.params['rsi_weak_overbought']:
                 score -= 1  # Approaching overbought
                 signals['RSI'] = -1
             else:
@@ -153,10 +352,10 @@ class TradingStrategy:
         stoch_d = self.safe_get_value('Stoch_D')
         
         if stoch_k is not None and stoch_d is not None:
-            if stoch_k < 20 and stoch_k > stoch_d:
+            if stoch_k < self.params['stoch_oversold'] and stoch_k > stoch_d:
                 score += 1.5
                 signals['Stochastic'] = 1
-            elif stoch_k > 80 and stoch_k < stoch_d:
+            elif stoch_k > self.params['stoch_overbought'] and stoch_k < stoch_d:
                 score -= 1.5
                 signals['Stochastic'] = -1
             else:
@@ -167,10 +366,10 @@ class TradingStrategy:
         # CCI
         cci = self.safe_get_value('CCI')
         if cci is not None:
-            if cci < -100:
+            if cci < self.params['cci_oversold']:
                 score += 1
                 signals['CCI'] = 1
-            elif cci > 100:
+            elif cci > self.params['cci_overbought']:
                 score -= 1
                 signals['CCI'] = -1
             else:
@@ -181,10 +380,10 @@ class TradingStrategy:
         # Williams %R
         williams = self.safe_get_value('Williams_R')
         if williams is not None:
-            if williams < -80:
+            if williams < self.params['williams_oversold']:
                 score += 1
                 signals['Williams_R'] = 1
-            elif williams > -20:
+            elif williams > self.params['williams_overbought']:
                 score -= 1
                 signals['Williams_R'] = -1
             else:
@@ -195,10 +394,10 @@ class TradingStrategy:
         # MFI (Money Flow Index)
         mfi = self.safe_get_value('MFI')
         if mfi is not None:
-            if mfi < 20:
+            if mfi < self.params['mfi_oversold']:
                 score += 1
                 signals['MFI'] = 1
-            elif mfi > 80:
+            elif mfi > self.params['mfi_overbought']:
                 score -= 1
                 signals['MFI'] = -1
             else:
@@ -348,6 +547,14 @@ class TradingStrategy:
         
         return score, signals
     
+    def score_history(self):
+        """
+        Score, signal and confidence for every bar instead of just the last one
+        
+        Vectorized counterpart of generate_signal; see score_history().
+        """
+        return score_history(self.df['Close'], self.df['Volume'], self.indicators, self.params)
+    
     def calculate_targets(self, signal, entry_price, margin=1000, leverage=1, position_size=1):
         """
         Calculate profit targets and stop loss for CFD trading
@@ -380,12 +587,9 @@ class TradingStrategy:
         
         if signal == "BUY":
             # Long position - profit when price goes up
-            targets = {
-                '3%': entry_price * 1.03,
-                '5%': entry_price * 1.05,
-                '10%': entry_price * 1.10
-            }
-            stop_loss = entry_price * 0.98  # 2% stop loss
+            targets = {name: entry_price * multiplier
+                       for name, multiplier in TARGET_MULTIPLIERS['BUY'].items()}
+            stop_loss = entry_price * STOP_LOSS_MULTIPLIERS['BUY']  # 2% stop loss
             
             # Calculate actual profit/loss in dollars with leverage
             price_move_3pct = (targets['3%'] - entry_price) * position_size
@@ -406,12 +610,9 @@ class TradingStrategy:
             
         elif signal == "SELL":
             # Short position - profit when price goes down
-            targets = {
-                '3%': entry_price * 0.97,
-                '5%': entry_price * 0.95,
-                '10%': entry_price * 0.90
-            }
-            stop_loss = entry_price * 1.02  # 2% stop loss
+            targets = {name: entry_price * multiplier
+                       for name, multiplier in TARGET_MULTIPLIERS['SELL'].items()}
+            stop_loss = entry_price * STOP_LOSS_MULTIPLIERS['SELL']  # 2% stop loss
             
             # Calculate actual profit/loss in dollars with leverage
             price_move_3pct = (entry_price - targets['3%']) * position_size
@@ -436,15 +637,13 @@ class TradingStrategy:
         
         return targets, stop_loss, cfd_calculations
     
-    def generate_signal(self, margin=1000, leverage=1, position_size=1):
+    def evaluate(self):
         """
-        Generate trading signal based on all indicators
-        Returns recommendation with confidence score and CFD calculations
+        Score the latest bar: signal, confidence, total score and the
+        per-indicator breakdown, without any position sizing
         
-        Args:
-            margin: Trading capital/margin (default: $1000)
-            leverage: Leverage multiplier (default: 1x)
-            position_size: Number of units/contracts (default: 1)
+        Depends only on the bars, indicators and params, so callers can cache
+        it and apply different margin/leverage with add_targets().
         """
         try:
             # Analyze all aspects
@@ -471,33 +670,28 @@ class TradingStrategy:
             print(f"📊 Scores: Trend={trend_score}, Momentum={momentum_score}, Volatility={volatility_score}, Volume={volume_score}, Strength={strength_score}")
             
             # Combine all signals
+            weights = category_weights(self.params)
             total_score = (
-                trend_score * 1.5 +      # Trend is important
-                momentum_score * 2.0 +    # Momentum is very important
-                volatility_score * 1.0 +  # Volatility context
-                volume_score * 1.2 +      # Volume confirmation
-                strength_score * 1.0      # Trend strength
+                trend_score * weights['trend'] +
+                momentum_score * weights['momentum'] +
+                volatility_score * weights['volatility'] +
+                volume_score * weights['volume'] +
+                strength_score * weights['strength']
             )
             
             print(f"📈 Total Score: {total_score}")
             
             # Normalize to get confidence (0-100%)
-            max_possible_score = abs(1.5 * 2.5 + 2.0 * 9.5 + 1.0 * 4 + 1.2 * 2 + 1.0 * 1.5)
-            confidence = min(100, (abs(total_score) / max_possible_score) * 100)
+            confidence = min(100, (abs(total_score) / max_possible_score(weights)) * 100)
             
             # Determine signal
-            if total_score > 5:
+            if total_score > self.params['buy_threshold']:
                 signal = "BUY"
-            elif total_score < -5:
+            elif total_score < self.params['sell_threshold']:
                 signal = "SELL"
             else:
                 signal = "HOLD"
             
-            # Calculate targets with CFD parameters
-            targets, stop_loss, cfd_calculations = self.calculate_targets(
-                signal, self.current_price, margin, leverage, position_size
-            )
-            
             # Combine all indicator signals
             all_signals = {
                 **trend_signals,
@@ -510,25 +704,56 @@ class TradingStrategy:
             return {
                 'signal': signal,
                 'entry_price': self.current_price,
-                'targets': targets,
-                'stop_loss': stop_loss,
                 'confidence': confidence,
                 'total_score': total_score,
-                'indicators': all_signals,
-                'cfd': cfd_calculations
+                'indicators': all_signals
             }
         except Exception as e:
-            print(f"Error in generate_signal: {e}")
+            print(f"Error in evaluate: {e}")
             import traceback
             traceback.print_exc()
             # Return safe default
             return {
                 'signal': 'HOLD',
                 'entry_price': self.current_price,
-                'targets': {'3%': 0, '5%': 0, '10%': 0},
-                'stop_loss': 0,
                 'confidence': 0,
                 'total_score': 0,
                 'indicators': {},
-                'cfd': {'margin': margin, 'leverage': leverage, 'error': str(e)}
+                'error': str(e)
+            }
+    
+    def add_targets(self, evaluation, margin=1000, leverage=1, position_size=1):
+        """
+        Complete an evaluate() result into a recommendation with targets,
+        stop loss and CFD calculations
+        
+        Args:
+            evaluation: Result of evaluate()
+            margin: Trading capital/margin (default: $1000)
+            leverage: Leverage multiplier (default: 1x)
+            position_size: Number of units/contracts (default: 1)
+        """
+        if 'error' in evaluation:
+            return {
+                **{key: value for key, value in evaluation.items() if key != 'error'},
+                'targets': {'3%': 0, '5%': 0, '10%': 0},
+                'stop_loss': 0,
+                'cfd': {'margin': margin, 'leverage': leverage, 'error': evaluation['error']}
             }
+        
+        targets, stop_loss, cfd_calculations = self.calculate_targets(
+            evaluation['signal'], evaluation['entry_price'], margin, leverage, position_size
+        )
+        return {**evaluation, 'targets': targets, 'stop_loss': stop_loss, 'cfd': cfd_calculations}
+    
+    def generate_signal(self, margin=1000, leverage=1, position_size=1):
+        """
+        Generate trading signal based on all indicators
+        Returns recommendation with confidence score and CFD calculations
+        
+        Args:
+            margin: Trading capital/margin (default: $1000)
+            leverage: Leverage multiplier (default: 1x)
+            position_size: Number of units/contracts (default: 1)
+        """
+        return self.add_targets(self.evaluate(), margin, leverage, position_size)
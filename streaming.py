@@ -0,0 +1,329 @@
+import math
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+
+def _div(numerator, denominator):
+    """Divide with IEEE semantics (x/0 -> inf, 0/0 -> nan) like pandas does"""
+    if denominator == 0:
+        if numerator == 0 or math.isnan(numerator):
+            return math.nan
+        return math.copysign(math.inf, numerator) * math.copysign(1.0, denominator)
+    return numerator / denominator
+
+
+class _RollingMean:
+    """Fixed-window rolling mean/sum with the same NaN rules as pandas .rolling()"""
+
+    def __init__(self, window):
+        self.window = window
+        self.values = deque()
+        self.total = 0.0
+        self.compensation = 0.0
+        self.nan_count = 0
+
+    def _add(self, value):
+        # Kahan summation keeps the running total in step with pandas' roll_sum
+        y = value - self.compensation
+        t = self.total + y
+        self.compensation = (t - self.total) - y
+        self.total = t
+
+    def update(self, value):
+        value = float(value)
+        self.values.append(value)
+        if math.isnan(value):
+            self.nan_count += 1
+        else:
+            self._add(value)
+
+        if len(self.values) > self.window:
+            old = self.values.popleft()
+            if math.isnan(old):
+                self.nan_count -= 1
+            else:
+                self._add(-old)
+
+        return self.mean()
+
+    def ready(self):
+        return len(self.values) == self.window and self.nan_count == 0
+
+    def sum(self):
+        if not self.ready():
+            return math.nan
+        if self.total == 0.0:
+            return 0.0
+        return self.total
+
+    def mean(self):
+        if not self.ready():
+            return math.nan
+        return self.total / self.window
+
+
+class _RollingVariance:
+    """Rolling sample variance using Welford add/remove updates"""
+
+    def __init__(self, window):
+        self.window = window
+        self.values = deque()
+        self.mean = 0.0
+        self.ssqdm = 0.0
+
+    def update(self, value):
+        value = float(value)
+        self.values.append(value)
+        nobs = len(self.values)
+        delta = value - self.mean
+        self.mean += delta / nobs
+        self.ssqdm += ((nobs - 1) * delta ** 2) / nobs
+
+        if nobs > self.window:
+            old = self.values.popleft()
+            nobs -= 1
+            delta = old - self.mean
+            self.mean -= delta / nobs
+            self.ssqdm -= ((nobs + 1) * delta ** 2) / nobs
+
+        return self.std()
+
+    def std(self):
+        if len(self.values) < self.window:
+            return math.nan
+        return math.sqrt(max(self.ssqdm, 0.0) / (self.window - 1))
+
+
+class _RollingExtreme:
+    """Rolling min or max over a fixed window using a monotonic deque"""
+
+    def __init__(self, window, mode='max'):
+        self.window = window
+        self.is_max = mode == 'max'
+        self.candidates = deque()
+        self.count = 0
+
+    def update(self, value):
+        value = float(value)
+        index = self.count
+        self.count += 1
+
+        if self.is_max:
+            while self.candidates and self.candidates[-1][1] <= value:
+                self.candidates.pop()
+        else:
+            while self.candidates and self.candidates[-1][1] >= value:
+                self.candidates.pop()
+        self.candidates.append((index, value))
+
+        if self.candidates[0][0] <= index - self.window:
+            self.candidates.popleft()
+
+        if self.count < self.window:
+            return math.nan
+        return self.candidates[0][1]
+
+
+class _EMA:
+    """Exponential moving average matching ewm(span=period, adjust=False)"""
+
+    def __init__(self, period):
+        self.alpha = 2.0 / (period + 1)
+        self.value = None
+
+    def update(self, value):
+        value = float(value)
+        if self.value is None:
+            self.value = value
+        else:
+            self.value = (1 - self.alpha) * self.value + self.alpha * value
+        return self.value
+
+
+class StreamingIndicators:
+    """
+    Incremental version of TechnicalIndicators
+
+    Keeps running state for every indicator produced by
+    TechnicalIndicators.calculate_all() so a new OHLCV bar can be folded in
+    without recomputing the whole history. Every indicator costs O(1) per
+    update, except CCI whose mean absolute deviation needs one pass over its
+    20-bar window.
+    """
+
+    def __init__(self):
+        self.bar_count = 0
+        self.prev_close = None
+        self.prev_high = None
+        self.prev_low = None
+        self.prev_typical_price = None
+        self.latest = {}
+
+        # Moving averages
+        self._sma = {period: _RollingMean(period) for period in (20, 50, 200)}
+        self._ema = {period: _EMA(period) for period in (12, 26)}
+
+        # RSI
+        self._rsi_gain = _RollingMean(14)
+        self._rsi_loss = _RollingMean(14)
+
+        # MACD
+        self._macd_signal = _EMA(9)
+
+        # Bollinger Bands
+        self._bb_std = _RollingVariance(20)
+
+        # Stochastic / Williams %R
+        self._low_min = _RollingExtreme(14, 'min')
+        self._high_max = _RollingExtreme(14, 'max')
+        self._stoch_d = _RollingMean(3)
+
+        # ATR / ADX
+        self._atr = _RollingMean(14)
+        self._pos_dm = _RollingMean(14)
+        self._neg_dm = _RollingMean(14)
+        self._adx = _RollingMean(14)
+
+        # OBV
+        self._obv = 0.0
+
+        # CCI
+        self._cci_tp = _RollingMean(20)
+
+        # MFI
+        self._mfi_pos = _RollingMean(14)
+        self._mfi_neg = _RollingMean(14)
+
+        # VWAP
+        self._vwap_pv = 0.0
+        self._vwap_volume = 0.0
+
+    @classmethod
+    def from_frame(cls, df):
+        """Build the running state from an existing OHLCV history"""
+        engine = cls()
+        for bar in df[['Open', 'High', 'Low', 'Close', 'Volume']].itertuples(index=False):
+            engine.update(bar._asdict())
+        return engine
+
+    def update(self, bar):
+        """
+        Fold one new OHLCV bar into the running state
+
+        Args:
+            bar: Mapping (dict, pandas Series, ...) with High, Low, Close and Volume
+
+        Returns:
+            Dictionary with the latest value of every indicator, using the
+            same keys as TechnicalIndicators.calculate_all()
+        """
+        high = float(bar['High'])
+        low = float(bar['Low'])
+        close = float(bar['Close'])
+        volume = float(bar['Volume'])
+        typical_price = (high + low + close) / 3
+
+        values = {}
+
+        # Moving Averages
+        for period, sma in self._sma.items():
+            values[f'SMA_{period}'] = sma.update(close)
+        for period, ema in self._ema.items():
+            values[f'EMA_{period}'] = ema.update(close)
+
+        # RSI
+        delta = close - self.prev_close if self.prev_close is not None else math.nan
+        avg_gain = self._rsi_gain.update(delta if delta > 0 else 0.0)
+        avg_loss = self._rsi_loss.update(-delta if delta < 0 else 0.0)
+        values['RSI'] = 100 - _div(100, 1 + _div(avg_gain, avg_loss))
+
+        # MACD
+        macd = values['EMA_12'] - values['EMA_26']
+        macd_signal = self._macd_signal.update(macd)
+        values['MACD'] = macd
+        values['MACD_signal'] = macd_signal
+        values['MACD_hist'] = macd - macd_signal
+
+        # Bollinger Bands
+        std = self._bb_std.update(close)
+        values['BB_upper'] = values['SMA_20'] + std * 2
+        values['BB_middle'] = values['SMA_20']
+        values['BB_lower'] = values['SMA_20'] - std * 2
+
+        # Stochastic
+        low_min = self._low_min.update(low)
+        high_max = self._high_max.update(high)
+        stoch_k = _div(100 * (close - low_min), high_max - low_min)
+        values['Stoch_K'] = stoch_k
+        values['Stoch_D'] = self._stoch_d.update(stoch_k)
+
+        # ATR
+        if self.prev_close is None:
+            true_range = high - low
+        else:
+            true_range = max(high - low, abs(high - self.prev_close), abs(low - self.prev_close))
+        atr = self._atr.update(true_range)
+        values['ATR'] = atr
+
+        # OBV
+        if self.prev_close is not None:
+            self._obv += float(np.sign(close - self.prev_close)) * volume
+        values['OBV'] = self._obv
+
+        # ADX
+        if self.prev_high is None:
+            pos_dm = neg_dm = 0.0
+        else:
+            high_diff = high - self.prev_high
+            low_diff = self.prev_low - low
+            pos_dm = high_diff if (high_diff > low_diff and high_diff > 0) else 0.0
+            neg_dm = low_diff if (low_diff > high_diff and low_diff > 0) else 0.0
+        pos_di = 100 * _div(self._pos_dm.update(pos_dm), atr)
+        neg_di = 100 * _div(self._neg_dm.update(neg_dm), atr)
+        dx = 100 * _div(abs(pos_di - neg_di), pos_di + neg_di)
+        values['ADX'] = self._adx.update(dx)
+        values['Plus_DI'] = pos_di
+        values['Minus_DI'] = neg_di
+
+        # CCI
+        sma_tp = self._cci_tp.update(typical_price)
+        if self._cci_tp.ready():
+            window = self._cci_tp.values
+            window_mean = sum(window) / len(window)
+            mad = sum(abs(x - window_mean) for x in window) / len(window)
+            values['CCI'] = _div(typical_price - sma_tp, 0.015 * mad)
+        else:
+            values['CCI'] = math.nan
+
+        # Williams %R
+        values['Williams_R'] = _div(-100 * (high_max - close), high_max - low_min)
+
+        # MFI
+        money_flow = typical_price * volume
+        prev_tp = self.prev_typical_price
+        positive_flow = money_flow if prev_tp is not None and typical_price > prev_tp else 0.0
+        negative_flow = money_flow if prev_tp is not None and typical_price < prev_tp else 0.0
+        self._mfi_pos.update(positive_flow)
+        self._mfi_neg.update(negative_flow)
+        positive_mf = self._mfi_pos.sum()
+        negative_mf = self._mfi_neg.sum()
+        values['MFI'] = 100 - _div(100, 1 + _div(positive_mf, negative_mf))
+
+        # VWAP
+        self._vwap_pv += typical_price * volume
+        self._vwap_volume += volume
+        values['VWAP'] = _div(self._vwap_pv, self._vwap_volume)
+
+        self.prev_close = close
+        self.prev_high = high
+        self.prev_low = low
+        self.prev_typical_price = typical_price
+        self.bar_count += 1
+        self.latest = values
+        return values
+
+    def to_series(self, index=None):
+        """Return the latest values as a pandas Series (one row of calculate_all)"""
+        return pd.Series(self.latest, name=index, dtype=float)
@@ -0,0 +1,146 @@
+import itertools
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+from backtest import simulate, summarize
+from indicators import TechnicalIndicators
+from strategy import score_history, strategy_params
+
+# Arrays each worker needs besides the indicators
+PRICE_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume']
+
+# Per-process state set up by _attach_worker()
+_worker = {}
+
+
+def grid(space):
+    """
+    Every combination of a parameter grid
+
+    Args:
+        space: Dict mapping DEFAULT_PARAMS names to lists of values
+
+    Returns:
+        List of parameter dicts
+    """
+    strategy_params(dict.fromkeys(space))
+    names = list(space)
+    return [dict(zip(names, values)) for values in itertools.product(*space.values())]
+
+
+def random_search(space, samples, seed=None):
+    """
+    Random parameter sets drawn from a search space
+
+    Args:
+        space: Dict mapping DEFAULT_PARAMS names to either a list of choices
+               or a (low, high) tuple sampled uniformly
+        samples: Number of parameter sets
+        seed: Optional random seed
+
+    Returns:
+        List of parameter dicts
+    """
+    strategy_params(dict.fromkeys(space))
+    rng = random.Random(seed)
+
+    def draw(values):
+        if isinstance(values, tuple):
+            return rng.uniform(*values)
+        return rng.choice(values)
+
+    return [{name: draw(values) for name, values in space.items()} for _ in range(samples)]
+
+
+def _attach_worker(shm_name, shape, names, backtest_options):
+    """Process pool initializer: map the shared arrays instead of unpickling them"""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    block = np.ndarray(shape, dtype=np.float64, buffer=shm.buf)
+    _worker['shm'] = shm
+    _worker['arrays'] = {name: block[i] for i, name in enumerate(names)}
+    _worker['backtest_options'] = backtest_options
+
+
+def _evaluate(params):
+    """Score and backtest one parameter set against the shared arrays"""
+    arrays = _worker['arrays']
+    options = _worker['backtest_options']
+
+    signals = score_history(arrays['Close'], arrays['Volume'], arrays, params)['signal']
+    trades = simulate(arrays['High'], arrays['Low'], arrays['Close'], signals, **options)
+    return summarize(trades, options['margin'])
+
+
+class ParameterSweep:
+    """
+    Grid or random search over strategy parameters
+
+    Indicators are computed once. The price and indicator arrays are copied
+    into one shared-memory block that every worker process maps read-only,
+    so each task only ships its small parameter dict. Each parameter set is
+    scored with score_history() and backtested with backtest.simulate().
+    """
+
+    def __init__(self, df, indicators=None, margin=1000, leverage=1, position_size=None,
+                 target='5%', max_holding=None):
+        if indicators is None:
+            indicators = TechnicalIndicators(df).calculate_all()
+
+        self.names = PRICE_COLUMNS + list(indicators)
+        columns = [df[name] for name in PRICE_COLUMNS] + [indicators[name] for name in indicators]
+        self.data = np.vstack([np.asarray(column, dtype=np.float64) for column in columns])
+        self.backtest_options = {
+            'margin': margin,
+            'leverage': leverage,
+            'position_size': position_size,
+            'target': target,
+            'max_holding': max_holding,
+        }
+
+    def run(self, param_sets, processes=None, rank_by='total_pnl', ascending=False, chunksize=None):
+        """
+        Evaluate parameter sets across a process pool
+
+        Args:
+            param_sets: Iterable of parameter dicts (see grid() and random_search())
+            processes: Worker processes (default: os.cpu_count())
+            rank_by: Metric from backtest.summarize() to sort by
+            ascending: Sort order (use True for e.g. 'max_drawdown')
+            chunksize: Tasks sent to a worker at a time (default: spread evenly)
+
+        Returns:
+            DataFrame with one row per parameter set (parameters plus metrics),
+            best first
+        """
+        param_sets = [strategy_params(params) for params in param_sets]
+        processes = processes or os.cpu_count() or 1
+        if chunksize is None:
+            chunksize = max(1, len(param_sets) // (processes * 4))
+
+        shm = shared_memory.SharedMemory(create=True, size=max(self.data.nbytes, 1))
+        try:
+            shared = np.ndarray(self.data.shape, dtype=np.float64, buffer=shm.buf)
+            shared[:] = self.data
+            del shared
+
+            initargs = (shm.name, self.data.shape, self.names, self.backtest_options)
+            with ProcessPoolExecutor(max_workers=processes, initializer=_attach_worker,
+                                     initargs=initargs) as executor:
+                results = list(executor.map(_evaluate, param_sets, chunksize=chunksize))
+        finally:
+            shm.close()
+            shm.unlink()
+
+        rows = []
+        for params, metrics in zip(param_sets, results):
+            row = dict(params)
+            row.update({name: value for name, value in metrics.items() if name != 'hit_rates'})
+            row.update({f'hit_rate_{name}': value for name, value in metrics['hit_rates'].items()})
+            rows.append(row)
+
+        return pd.DataFrame(rows).sort_values(rank_by, ascending=ascending, ignore_index=True)